@@ -45,6 +45,32 @@ class _Export:
         """Return repr of self.export_data."""
         return repr(self.export_data)
 
+    def iter_export_repr(self):
+        """Yield repr of self.export_data in pieces, one per list item.
+
+        The pieces joined are equal to export_repr() but the complete
+        text is never held in memory.
+
+        """
+        yield "["
+        for count, item in enumerate(self.export_data):
+            if count:
+                yield ", "
+            yield repr(item)
+        yield "]"
+
+    def write_export(self, export_file):
+        """Write repr of self.export_data to export_file.
+
+        This method is expected to run in a thread so a failure to write
+        the file is noted in self.error_message rather than raised.
+
+        """
+        try:
+            write_export_file(export_file, self.iter_export_repr())
+        except OSError as exc:
+            self.error_message = str(exc)
+
 
 class _ExportSelected(_Export):
     """Export selected and bookmarked persons from database."""
@@ -277,9 +303,17 @@ def _export_aliases_of_person(
 
 
 def write_export_file(export_file, serialized_data):
-    """Write serialized data to export file."""
+    """Write serialized data to export file.
+
+    serialized_data is a str or an iterable of str, such as the generator
+    returned by the iter_export_repr method of an exporter.
+
+    """
     with open(export_file, "w", encoding="utf-8") as output:
-        output.write(serialized_data)
+        if isinstance(serialized_data, str):
+            output.write(serialized_data)
+        else:
+            output.writelines(serialized_data)
 
 
 def read_export_file(import_file):
@@ -4,11 +4,11 @@
 
 """Chess Performance Calculation application."""
 import os
+import functools
 import tkinter
 import tkinter.ttk
 import tkinter.messagebox
 import tkinter.filedialog
-import multiprocessing
 import datetime
 
 from solentware_bind.gui.bindings import Bindings
@@ -24,7 +24,6 @@ from ..core import configuration
 from ..core import constants
 from ..core import filespec
 from .. import APPLICATION_DATABASE_MODULE, ERROR_LOG, REPORT_DIRECTORY
-from ..shared import rundu
 from . import games
 from . import players
 from . import persons
@@ -55,6 +54,48 @@ STARTUP_MINIMUM_WIDTH = 380
 STARTUP_MINIMUM_HEIGHT = 400
 _MENU_SEPARATOR = (None, None)
 
+# Dialogue titles and messages without variable parts.
+_SELECT_DATABASE_FOLDER = (
+    "Select folder containing a performance calculation database"
+)
+_SELECT_PGN_FOLDER = "".join(
+    (
+        "Select folder containing PGN files for import to ",
+        "the open performance calculation database",
+    )
+)
+_NO_DATABASE_FOR_IMPORT = (
+    "No performance calculation database open to receive import"
+)
+_DELETE_NEEDS_OPEN_DATABASE = "".join(
+    (
+        "Delete will not delete a database unless it can be ",
+        "opened.\n\nOpen the database and then Delete it.",
+    )
+)
+_DATABASE_NOT_DELETED = (
+    "The performance calculation database has not been deleted"
+)
+_NEW_DATABASE_CANCELLED = (
+    "Create new performance calculation database cancelled"
+)
+_NO_ENGINE_TO_CREATE_DATABASE = (
+    "None of the available database engines can be used to create a database."
+)
+_PLAYERS_TAB_NOT_VISIBLE = (
+    "List of new players is not the visible tab at present"
+)
+_SELECTORS_TAB_NOT_VISIBLE = (
+    "List of game selection rules is not the visible tab at present"
+)
+_RULE_TAB_NOT_VISIBLE = (
+    "A game selection rule is not the visible tab at present"
+)
+_SELECTORS_GRID_NOT_AVAILABLE = (
+    "List of game selection rules not available at present"
+)
+_REPORT_TAB_NOT_VISIBLE = "A report is not the visible tab at present"
+
 _HELP_TEXT = "".join(
     (
         "Performance calculations are based on either a particular ",
@@ -144,6 +185,7 @@ class Calculator(Bindings):
         self.database_folder = None
         self._pgn_directory = None
         self._import_subprocess = None
+        self._help_toplevel = None
         self._notebook = None
         self._games_tab = None
         self._players_tab = None
@@ -157,7 +199,11 @@ class Calculator(Bindings):
         self._calculations_tab = None
         self._rule_tabs = {}
         self._report_tabs = {}
+        self._stale_grids = set()
+        self._unpopulated_reports = {}
         self._remove_pgn_tabs = {}
+        self._tab_owners = {}
+        self._winfo_pathname_fails = False
         self._games = None
         self._players = None
         self._persons = None
@@ -173,6 +219,11 @@ class Calculator(Bindings):
         self._maskscroll = {}
         self._maskpopup = {}
         self._maskresizeable = None
+
+        # Wrapped once because it is rescheduled every second during import.
+        self._import_pgnfiles_join_command = self.try_command(
+            self._import_pgnfiles_join, self.widget
+        )
         try:
             self._initialize()
         except Exception as exc:
@@ -457,6 +508,16 @@ class Calculator(Bindings):
         # Enable tab traversal.
         notebook.enable_traversal()
 
+        # Grids and reports whose refresh is deferred until their tab is
+        # visible.
+        self._stale_grids.clear()
+        self._unpopulated_reports.clear()
+        self.bind(
+            notebook,
+            "<<NotebookTabChanged>>",
+            function=self._refresh_visible_tab,
+        )
+
         # So it can be destoyed when closing database but not quitting.
         self._notebook = notebook
 
@@ -492,17 +553,16 @@ class Calculator(Bindings):
             self._modes,
             self._selectors,
         ):
-            if subject.data_grid.parent is self._masktab:
-                subject.data_grid.bind_on()
+            data_grid = subject.data_grid
+            if data_grid.parent is self._masktab:
+                data_grid.bind_on()
                 for sbar, command in self._maskscroll.items():
                     sbar.configure(command=command)
                 self._masktab = None
                 self._maskscroll.clear()
                 for grid, binding in self._maskpopup.items():
                     grid.show_popup_menu = binding
-                subject.data_grid.scroller.state(
-                    statespec=["!" + tkinter.DISABLED]
-                )
+                data_grid.scroller.state(statespec=["!" + tkinter.DISABLED])
                 self._maskpopup.clear()
                 break
         else:
@@ -591,8 +651,18 @@ class Calculator(Bindings):
         return True
 
     def _help_widget(self):
-        """Display help in a Toplevel."""
+        """Display help in a Toplevel.
+
+        The Toplevel is raised rather than created again if it exists.
+
+        """
+        help_toplevel = self._help_toplevel
+        if help_toplevel is not None and help_toplevel.winfo_exists():
+            help_toplevel.deiconify()
+            help_toplevel.lift()
+            return
         widget = tkinter.Toplevel(master=self.widget)
+        self._help_toplevel = widget
         rule_help = tkinter.Text(master=widget, wrap=tkinter.WORD)
         rule_help.grid_configure(column=0, row=0, sticky=tkinter.NSEW)
         widget.grid_columnconfigure(0, weight=1)
@@ -712,7 +782,7 @@ class Calculator(Bindings):
         """Prepare player data for export."""
         exporter = export.ExportIdentities(database)
         exporter.prepare_export_data()
-        answer["serialized_data"] = exporter.export_repr()
+        answer["exporter"] = exporter
 
     def _database_export_identities(self):
         """Export player identifications."""
@@ -735,14 +805,6 @@ class Calculator(Bindings):
                 message="Database interface not defined",
             )
             return None
-        self._apply_lock()
-        answer = {"serialized_data": None}
-        task.Task(
-            self.database,
-            self._export_player_identities,
-            (self.database, answer),
-            self._update_widget_and_join_loop,
-        ).start_and_join()
         directory = os.path.join(
             self.database.home_directory, REPORT_DIRECTORY
         )
@@ -770,32 +832,67 @@ class Calculator(Bindings):
                     )
                 ),
             )
-            if os.path.exists(export_file):
-                if not tkinter.messagebox.askyesno(
+            if not os.path.exists(export_file):
+                break
+            if not tkinter.messagebox.askyesno(
+                parent=self.widget,
+                title=title,
+                message="".join(
+                    (
+                        os.path.basename(export_file),
+                        " exists\n\nPlease try again",
+                        " to get a new timestamp",
+                    )
+                ),
+            ):
+                tkinter.messagebox.showinfo(
                     parent=self.widget,
+                    message="Export of event persons cancelled",
                     title=title,
-                    message="".join(
-                        (
-                            os.path.basename(export_file),
-                            " exists\n\nPlease try again",
-                            " to get a new timestamp",
-                        )
-                    ),
-                ):
-                    tkinter.messagebox.showinfo(
-                        parent=self.widget,
-                        message="Export of event persons cancelled",
-                        title=title,
+                )
+                return False
+        answer = {"exporter": None}
+        self._apply_lock()
+        try:
+            task.Task(
+                self.database,
+                self._export_player_identities,
+                (self.database, answer),
+                self._update_widget_and_join_loop,
+            ).start_and_join()
+            if answer["exporter"] is not None:
+                task.Task(
+                    None,
+                    answer["exporter"].write_export,
+                    (export_file,),
+                    self._update_widget_and_join_loop,
+                ).start_and_join()
+        finally:
+            self._clear_lock()
+        if answer["exporter"] is None:
+            tkinter.messagebox.showinfo(
+                parent=self.widget,
+                message="\n\n".join(
+                    (
+                        "Export of player identities failed",
+                        "Unable to extract data",
                     )
-                    return False
-                continue
-            break
-        task.Task(
-            self.database,
-            export.write_export_file,
-            (export_file, answer["serialized_data"]),
-            self._update_widget_and_join_loop,
-        ).start_and_join()
+                ),
+                title=title,
+            )
+            return False
+        if answer["exporter"].error_message is not None:
+            tkinter.messagebox.showinfo(
+                parent=self.widget,
+                message="\n\n".join(
+                    (
+                        "Export of player identities failed",
+                        answer["exporter"].error_message,
+                    )
+                ),
+                title=title,
+            )
+            return False
         tkinter.messagebox.showinfo(
             parent=self.widget,
             message="".join(
@@ -806,7 +903,6 @@ class Calculator(Bindings):
             ),
             title=title,
         )
-        self._clear_lock()
         return True
 
     def _database_close(self):
@@ -855,10 +951,7 @@ class Calculator(Bindings):
             return
         frame = tkinter.ttk.Frame(master=self._notebook)
         tab = reportremovepgn.ReportRemovePGN(frame, self.database)
-        try:
-            self._remove_pgn_tabs[frame.winfo_pathname(frame.winfo_id())] = tab
-        except tkinter.TclError as exc:
-            self._remove_pgn_tabs[workarounds.winfo_pathname(frame, exc)] = tab
+        self._register_tab(self._remove_pgn_tabs, frame, tab)
         self._notebook.add(frame, text="PGN report")
         self._notebook.select(frame)
         self._apply_lock()
@@ -878,9 +971,7 @@ class Calculator(Bindings):
                     self._players.players_grid,
                     self._players.persons_grid,
                 ):
-                    grid.clear_selections()
-                    grid.clear_bookmarks()
-                    grid.fill_view_with_top()
+                    grid.reset_view()
         finally:
             self._clear_lock()
         self._notebook.select(self._games_tab)
@@ -901,12 +992,7 @@ class Calculator(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title="Delete",
-                message="".join(
-                    (
-                        "Delete will not delete a database unless it can be ",
-                        "opened.\n\nOpen the database and then Delete it.",
-                    )
-                ),
+                message=_DELETE_NEEDS_OPEN_DATABASE,
             )
             return
         dlg = tkinter.messagebox.askquestion(
@@ -949,12 +1035,7 @@ class Calculator(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title="Delete",
-                message="".join(
-                    (
-                        "The performance calculation database ",
-                        "has not been deleted",
-                    )
-                ),
+                message=_DATABASE_NOT_DELETED,
             )
 
     def _database_new(self):
@@ -978,12 +1059,7 @@ class Calculator(Bindings):
         if not database_folder:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
-                message="".join(
-                    (
-                        "Create new performance calculation ",
-                        "database cancelled",
-                    )
-                ),
+                message=_NEW_DATABASE_CANCELLED,
                 title="New",
             )
             return
@@ -1074,13 +1150,7 @@ class Calculator(Bindings):
         if _modulename is None:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
-                message="".join(
-                    (
-                        "None of the available database engines can be ",
-                        "used to ",
-                        "create a database.",
-                    )
-                ),
+                message=_NO_ENGINE_TO_CREATE_DATABASE,
                 title="New",
             )
             return
@@ -1102,19 +1172,17 @@ class Calculator(Bindings):
             )
             return
 
-        conf = configuration.Configuration()
+        # The configuration is not needed if a database has been opened
+        # already, until a database folder is chosen.
         if self.database_folder is None:
-            initdir = conf.get_configuration_value(constants.RECENT_DATABASE)
+            initdir = configuration.Configuration().get_configuration_value(
+                constants.RECENT_DATABASE
+            )
         else:
             initdir = self.database_folder
         database_folder = tkinter.filedialog.askdirectory(
             parent=self.widget,
-            title="".join(
-                (
-                    "Select folder containing a performance ",
-                    "calculation database",
-                )
-            ),
+            title=_SELECT_DATABASE_FOLDER,
             initialdir=initdir,
             mustexist=tkinter.TRUE,
         )
@@ -1125,6 +1193,7 @@ class Calculator(Bindings):
                 title="Open",
             )
             return
+        conf = configuration.Configuration()
         conf.set_configuration_value(
             constants.RECENT_DATABASE,
             conf.convert_home_directory_to_tilde(database_folder),
@@ -1165,25 +1234,27 @@ class Calculator(Bindings):
             )
             return
 
-        idm = modulequery.installed_database_modules()
-        _enginename = None
-        for key, value in idm.items():
-            if value in exdb[0]:
-                if _enginename:
-                    tkinter.messagebox.showinfo(
-                        parent=self.widget,
-                        message="".join(
-                            (
-                                "Several modules able to open database in\n\n",
-                                os.path.basename(database_folder),
-                                "\n\navailable.  Unable to choose.",
-                            )
-                        ),
-                        title="Open",
+        # exdb[0] is a set of modules so the membership tests are hashed.
+        existing_modules = exdb[0]
+        enginenames = [
+            key
+            for key, value in modulequery.installed_database_modules().items()
+            if value in existing_modules
+        ]
+        if len(enginenames) > 1:
+            tkinter.messagebox.showinfo(
+                parent=self.widget,
+                message="".join(
+                    (
+                        "Several modules able to open database in\n\n",
+                        os.path.basename(database_folder),
+                        "\n\navailable.  Unable to choose.",
                     )
-                    return
-                _enginename = key
-        if _enginename is None:
+                ),
+                title="Open",
+            )
+            return
+        if not enginenames:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 message="".join(
@@ -1196,6 +1267,7 @@ class Calculator(Bindings):
                 title="Open",
             )
             return
+        _enginename = enginenames[0]
         _modulename = APPLICATION_DATABASE_MODULE[_enginename]
         self._open_database_with_engine(
             database_folder, _modulename, _enginename, "Open", "open"
@@ -1311,12 +1383,7 @@ class Calculator(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title="Import",
-                message="".join(
-                    (
-                        "No performance calculation database open to ",
-                        "receive import",
-                    )
-                ),
+                message=_NO_DATABASE_FOR_IMPORT,
             )
             return
         if self._database_class is None:
@@ -1330,12 +1397,7 @@ class Calculator(Bindings):
         initdir = conf.get_configuration_value(constants.RECENT_PGN_DIRECTORY)
         pgn_directory = tkinter.filedialog.askdirectory(
             parent=self.widget,
-            title="".join(
-                (
-                    "Select folder containing PGN files for import to ",
-                    "the open performance calculation database",
-                )
-            ),
+            title=_SELECT_PGN_FOLDER,
             initialdir=initdir,
             mustexist=tkinter.TRUE,
         )
@@ -1355,6 +1417,11 @@ class Calculator(Bindings):
 
     def _import_pgnfiles(self, pgn_directory):
         """Import games to open database."""
+        # pylint message import-outside-toplevel.
+        # Import is a rare action so these are not imported at start-up.
+        import multiprocessing
+        from ..shared import rundu
+
         self._set_import_subprocess()  # raises exception if already active
         self._pgn_directory = pgn_directory
         self._games.data_grid.bind_off()
@@ -1400,8 +1467,9 @@ class Calculator(Bindings):
     def _import_pgnfiles_join(self):
         """After deferred_update process allow quit and reopen database."""
         if self.get_import_subprocess().exitcode is None:
-            self.widget.after(1000, self._import_pgnfiles_join)
+            self.widget.after(1000, self._import_pgnfiles_join_command)
             return
+        self._import_subprocess = None
         self._clear_lock()
         self.database.open_database()
         self._games.data_grid.bind_on()
@@ -1443,12 +1511,7 @@ class Calculator(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title=title,
-                message="".join(
-                    (
-                        "List of new players is ",
-                        "not the visible tab at present",
-                    )
-                ),
+                message=_PLAYERS_TAB_NOT_VISIBLE,
             )
             return False
         return True
@@ -1466,11 +1529,8 @@ class Calculator(Bindings):
         self._apply_lock()
         try:
             if self._players.identify(self._update_widget_and_join_loop):
-                self._players.players_grid.clear_selections()
-                self._players.players_grid.clear_bookmarks()
-                self._players.persons_grid.clear_selections()
-                self._players.players_grid.fill_view_with_top()
-                self._players.persons_grid.fill_view_with_top()
+                self._players.players_grid.reset_view()
+                self._players.persons_grid.reset_view(keep_bookmarks=True)
                 self._persons.data_grid.fill_view_with_top()
         finally:
             self._clear_lock()
@@ -1490,11 +1550,8 @@ class Calculator(Bindings):
             if self._players.identify_by_name(
                 self._update_widget_and_join_loop
             ):
-                self._players.players_grid.clear_selections()
-                self._players.players_grid.clear_bookmarks()
-                self._players.persons_grid.clear_selections()
-                self._players.players_grid.fill_view_with_top()
-                self._players.persons_grid.fill_view_with_top()
+                self._players.players_grid.reset_view()
+                self._players.persons_grid.reset_view(keep_bookmarks=True)
                 self._persons.data_grid.fill_view_with_top()
         finally:
             self._clear_lock()
@@ -1514,12 +1571,8 @@ class Calculator(Bindings):
             if self._players.match_players_by_name(
                 self._update_widget_and_join_loop
             ):
-                self._players.players_grid.clear_selections()
-                self._players.players_grid.clear_bookmarks()
-                self._players.persons_grid.clear_selections()
-                self._players.persons_grid.clear_bookmarks()
-                self._players.players_grid.fill_view_with_top()
-                self._players.persons_grid.fill_view_with_top()
+                self._players.players_grid.reset_view()
+                self._players.persons_grid.reset_view()
                 self._persons.data_grid.fill_view_with_top()
         finally:
             self._clear_lock()
@@ -1577,13 +1630,9 @@ class Calculator(Bindings):
         self._apply_lock()
         try:
             if self._persons.break_selected(self._update_widget_and_join_loop):
-                self._players.persons_grid.clear_selections()
-                self._players.persons_grid.clear_bookmarks()
-                self._persons.data_grid.clear_selections()
-                self._persons.data_grid.clear_bookmarks()
                 self._players.players_grid.fill_view_with_top()
-                self._players.persons_grid.fill_view_with_top()
-                self._persons.data_grid.fill_view_with_top()
+                self._players.persons_grid.reset_view()
+                self._persons.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -1598,13 +1647,9 @@ class Calculator(Bindings):
         self._apply_lock()
         try:
             if self._persons.split_all(self._update_widget_and_join_loop):
-                self._players.persons_grid.clear_selections()
-                self._players.persons_grid.clear_bookmarks()
-                self._persons.data_grid.clear_selections()
-                self._persons.data_grid.clear_bookmarks()
                 self._players.players_grid.fill_view_with_top()
-                self._players.persons_grid.fill_view_with_top()
-                self._persons.data_grid.fill_view_with_top()
+                self._players.persons_grid.reset_view()
+                self._persons.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -1621,12 +1666,8 @@ class Calculator(Bindings):
             if self._persons.change_identity(
                 self._update_widget_and_join_loop
             ):
-                self._players.persons_grid.clear_selections()
-                self._players.persons_grid.clear_bookmarks()
-                self._persons.data_grid.clear_selections()
-                self._persons.data_grid.clear_bookmarks()
-                self._players.persons_grid.fill_view_with_top()
-                self._persons.data_grid.fill_view_with_top()
+                self._players.persons_grid.reset_view()
+                self._persons.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -1643,12 +1684,8 @@ class Calculator(Bindings):
             if self._persons.export_selected_players(
                 self._update_widget_and_join_loop
             ):
-                self._players.persons_grid.clear_selections()
-                self._players.persons_grid.clear_bookmarks()
-                self._persons.data_grid.clear_selections()
-                self._persons.data_grid.clear_bookmarks()
-                self._players.persons_grid.fill_view_with_top()
-                self._persons.data_grid.fill_view_with_top()
+                self._players.persons_grid.reset_view()
+                self._persons.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -1725,27 +1762,37 @@ class Calculator(Bindings):
                 message=str(exc),
             )
             return
-        try:
-            self._rule_tabs[frame.winfo_pathname(frame.winfo_id())] = tab
-        except tkinter.TclError as exc:
-            self._rule_tabs[workarounds.winfo_pathname(frame, exc)] = tab
+        self._register_tab(self._rule_tabs, frame, tab)
         self._notebook.add(frame, text="New Rule")
-        if persons_sel or self._persons.data_grid.bookmarks:
-            self._persons.data_grid.clear_selections()
-            self._persons.data_grid.clear_bookmarks()
-            self._persons.data_grid.fill_view_with_top()
-        if events_sel or events_bmk:
-            self._events.data_grid.clear_selections()
-            self._events.data_grid.clear_bookmarks()
-            self._events.data_grid.fill_view_with_top()
-        if time_controls_sel or self._time_controls.data_grid.bookmarks:
-            self._time_controls.data_grid.clear_selections()
-            self._time_controls.data_grid.clear_bookmarks()
-            self._time_controls.data_grid.fill_view_with_top()
-        if modes_sel or self._modes.data_grid.bookmarks:
-            self._modes.data_grid.clear_selections()
-            self._modes.data_grid.clear_bookmarks()
-            self._modes.data_grid.fill_view_with_top()
+        visible_tab = self._notebook.select()
+        for grid, selection in (
+            (self._persons.data_grid, persons_sel),
+            (self._events.data_grid, events_sel),
+            (self._time_controls.data_grid, time_controls_sel),
+            (self._modes.data_grid, modes_sel),
+        ):
+            if not (selection or grid.bookmarks):
+                continue
+            if str(grid.parent) == visible_tab:
+                grid.reset_view()
+            else:
+                grid.clear_selections()
+                grid.clear_bookmarks()
+                self._stale_grids.add(grid)
+
+    def _refresh_visible_tab(self, event=None):
+        """Fill grid or populate report on visible tab if refresh deferred."""
+        del event
+        visible_tab = self._notebook.select()
+        report = self._unpopulated_reports.pop(visible_tab, None)
+        if report is not None:
+            self._report_tabs[visible_tab].populate(report)
+            return
+        for grid in self._stale_grids:
+            if str(grid.parent) == visible_tab:
+                self._stale_grids.remove(grid)
+                grid.fill_view_with_top()
+                break
 
     def _selectors_new(self):
         """Define new rule to select games for performance calculation."""
@@ -1772,16 +1819,11 @@ class Calculator(Bindings):
         frame = tkinter.ttk.Frame(master=self._notebook)
         tab = displayclass(frame, self.database)
         tab_from_selection.get_rule(tab, selectors_sel, self.database)
-        try:
-            self._rule_tabs[frame.winfo_pathname(frame.winfo_id())] = tab
-        except tkinter.TclError as exc:
-            self._rule_tabs[workarounds.winfo_pathname(frame, exc)] = tab
+        self._register_tab(self._rule_tabs, frame, tab)
         self._notebook.add(
             frame, text=" ".join((caption, tab.get_rule_name_from_tab()))
         )
-        self._selectors.data_grid.clear_selections()
-        self._selectors.data_grid.clear_bookmarks()
-        self._selectors.data_grid.fill_view_with_top()
+        self._selectors.data_grid.reset_view()
 
     def _selectors_show(self):
         """Show selected rule to select games for performance calculation."""
@@ -1821,12 +1863,7 @@ class Calculator(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title=menu_event_spec[1],
-                message="".join(
-                    (
-                        "List of game selection rules is ",
-                        "not the visible tab at present",
-                    )
-                ),
+                message=_SELECTORS_TAB_NOT_VISIBLE,
             )
             return False
         return True
@@ -1850,11 +1887,12 @@ class Calculator(Bindings):
             EventSpec.menu_selectors_close
         ):
             return
-        tab = self._selectors_apply(EventSpec.menu_selectors_close)
-        if not tab:
+        tab, rule = self._selectors_apply(EventSpec.menu_selectors_close)
+        if rule is None:
             return
         self._notebook.forget(tab)
         del self._rule_tabs[tab]
+        del self._tab_owners[tab]
 
     def _selectors_insert(self):
         """Insert rule to select games for performance calculation."""
@@ -1862,17 +1900,13 @@ class Calculator(Bindings):
             EventSpec.menu_selectors_insert
         ):
             return
-        tab = self._selectors_apply(EventSpec.menu_selectors_insert)
-        if not tab:
+        rule = self._selectors_apply(EventSpec.menu_selectors_insert)[1]
+        if rule is None:
             return
         self._apply_lock()
         try:
-            if self._rule_tabs[tab].insert_rule(
-                self._update_widget_and_join_loop
-            ):
-                self._selectors.data_grid.clear_selections()
-                self._selectors.data_grid.clear_bookmarks()
-                self._selectors.data_grid.fill_view_with_top()
+            if rule.insert_rule(self._update_widget_and_join_loop):
+                self._selectors.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -1882,17 +1916,13 @@ class Calculator(Bindings):
             EventSpec.menu_selectors_update
         ):
             return
-        tab = self._selectors_apply(EventSpec.menu_selectors_update)
-        if not tab:
+        rule = self._selectors_apply(EventSpec.menu_selectors_update)[1]
+        if rule is None:
             return
         self._apply_lock()
         try:
-            if self._rule_tabs[tab].update_rule(
-                self._update_widget_and_join_loop
-            ):
-                self._selectors.data_grid.clear_selections()
-                self._selectors.data_grid.clear_bookmarks()
-                self._selectors.data_grid.fill_view_with_top()
+            if rule.update_rule(self._update_widget_and_join_loop):
+                self._selectors.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -1902,43 +1932,41 @@ class Calculator(Bindings):
             EventSpec.menu_selectors_delete
         ):
             return
-        tab = self._selectors_apply(EventSpec.menu_selectors_delete)
-        if not tab:
+        rule = self._selectors_apply(EventSpec.menu_selectors_delete)[1]
+        if rule is None:
             return
         self._apply_lock()
         try:
-            if self._rule_tabs[tab].delete_rule():
-                self._selectors.data_grid.clear_selections()
-                self._selectors.data_grid.clear_bookmarks()
-                self._selectors.data_grid.fill_view_with_top()
+            if rule.delete_rule():
+                self._selectors.data_grid.reset_view()
         finally:
             self._clear_lock()
 
     def _selectors_apply(self, menu_event_spec):
-        """Return tab if a selection rule tab is visible, False otherwise."""
+        """Return (tab, rule) for visible selection rule tab.
+
+        Return (None, None) if a selection rule tab is not visible.
+
+        """
         if self._selectors is None or self._selectors.frame is None:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title=menu_event_spec[1],
                 message="Game selector rule not available at present",
             )
-            return False
+            return None, None
         if not self._selectors_grid_available(menu_event_spec):
-            return False
+            return None, None
         tab = self._notebook.select()
-        if tab not in self._rule_tabs:
+        rule = self._rule_tabs.get(tab)
+        if rule is None:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title=menu_event_spec[1],
-                message="".join(
-                    (
-                        "A game selection rule is ",
-                        "not the visible tab at present",
-                    )
-                ),
+                message=_RULE_TAB_NOT_VISIBLE,
             )
-            return False
-        return tab
+            return None, None
+        return tab, rule
 
     def _selectors_grid_available(self, menu_event_spec):
         """Return True if the selectors grid is visible."""
@@ -1946,94 +1974,79 @@ class Calculator(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title=menu_event_spec[1],
-                message="".join(
-                    ("List of game selection rules not available at present",)
-                ),
+                message=_SELECTORS_GRID_NOT_AVAILABLE,
             )
             return False
         return True
 
-    def _is_event_tab_visible(self, title, prefix):
-        """Return True if event tab is visible or False if not."""
-        return self._is_instance_tab_visible(
-            self._events, self._events_tab, "events", title, prefix
-        )
+    def _other_identity_action(
+        self, menu_event_spec, is_tab_visible, instance, action, prefix
+    ):
+        """Apply action to identities of visible tab for menu_event_spec.
 
-    def _event_identify(self):
-        """Identify selected and bookmarked events as selected event."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_event_identify
-        ):
-            return
-        if not self._is_event_tab_visible(
-            EventSpec.menu_other_event_identify[1], "Identify event"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._events.identify(self._update_widget_and_join_loop):
-                self._events.data_grid.clear_selections()
-                self._events.data_grid.clear_bookmarks()
-                self._events.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+        is_tab_visible is the name of the method which checks the tab is
+        visible.  instance is the name of the attribute which refers to the
+        tab's subject, and action is the name of the subject's method which
+        does the identify, break, split, or change, action.
 
-    def _event_break(self):
-        """Break indentification of selected and bookmarked event aliases."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_event_break
-        ):
+        """
+        if not self._set_lock_to_eventspec_name(menu_event_spec):
             return
-        if not self._is_event_tab_visible(
-            EventSpec.menu_other_event_break[1], "Break event aliases"
-        ):
+        if not getattr(self, is_tab_visible)(menu_event_spec[1], prefix):
             return
+        subject = getattr(self, instance)
         self._apply_lock()
         try:
-            if self._events.break_selected(self._update_widget_and_join_loop):
-                self._events.data_grid.clear_selections()
-                self._events.data_grid.clear_bookmarks()
-                self._events.data_grid.fill_view_with_top()
+            if getattr(subject, action)(self._update_widget_and_join_loop):
+                subject.data_grid.reset_view()
         finally:
             self._clear_lock()
 
-    def _event_split(self):
-        """Split indentification of all aliases of selected event alias."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_event_split
-        ):
-            return
-        if not self._is_event_tab_visible(
-            EventSpec.menu_other_event_split[1], "Split all events"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._events.split_all(self._update_widget_and_join_loop):
-                self._events.data_grid.clear_selections()
-                self._events.data_grid.clear_bookmarks()
-                self._events.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    def _is_event_tab_visible(self, title, prefix):
+        """Return True if event tab is visible or False if not."""
+        return self._is_instance_tab_visible(
+            self._events, self._events_tab, "events", title, prefix
+        )
 
-    def _event_change(self):
-        """Change event alias used as event identity."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_event_change
-        ):
-            return
-        if not self._is_event_tab_visible(
-            EventSpec.menu_other_event_change[1], "Change event identity"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._events.change_identity(self._update_widget_and_join_loop):
-                self._events.data_grid.clear_selections()
-                self._events.data_grid.clear_bookmarks()
-                self._events.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Identify selected and bookmarked events as selected event.
+    _event_identify = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_event_identify,
+        "_is_event_tab_visible",
+        "_events",
+        "identify",
+        "Identify event",
+    )
+
+    # Break indentification of selected and bookmarked event aliases.
+    _event_break = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_event_break,
+        "_is_event_tab_visible",
+        "_events",
+        "break_selected",
+        "Break event aliases",
+    )
+
+    # Split indentification of all aliases of selected event alias.
+    _event_split = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_event_split,
+        "_is_event_tab_visible",
+        "_events",
+        "split_all",
+        "Split all events",
+    )
+
+    # Change event alias used as event identity.
+    _event_change = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_event_change,
+        "_is_event_tab_visible",
+        "_events",
+        "change_identity",
+        "Change event identity",
+    )
 
     def _event_export_persons(self):
         """Export known players for events in selection and bookmarks.
@@ -2055,9 +2068,7 @@ class Calculator(Bindings):
             if self._events.export_players_in_selected_events(
                 self._update_widget_and_join_loop
             ):
-                self._events.data_grid.clear_selections()
-                self._events.data_grid.clear_bookmarks()
-                self._events.data_grid.fill_view_with_top()
+                self._events.data_grid.reset_view()
         finally:
             self._clear_lock()
 
@@ -2071,87 +2082,45 @@ class Calculator(Bindings):
             prefix,
         )
 
-    def _time_identify(self):
-        """Identify bookmarked time controls as selected time control."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_time_identify
-        ):
-            return
-        if not self._is_time_tab_visible(
-            EventSpec.menu_other_time_identify[1], "Identify time control"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._time_controls.identify(self._update_widget_and_join_loop):
-                self._time_controls.data_grid.clear_selections()
-                self._time_controls.data_grid.clear_bookmarks()
-                self._time_controls.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Identify bookmarked time controls as selected time control.
+    _time_identify = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_time_identify,
+        "_is_time_tab_visible",
+        "_time_controls",
+        "identify",
+        "Identify time control",
+    )
 
-    def _time_break(self):
-        """Break indentity of selected and bookmarked time control aliases."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_time_break
-        ):
-            return
-        if not self._is_time_tab_visible(
-            EventSpec.menu_other_time_break[1], "Break time control aliases"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._time_controls.break_selected(
-                self._update_widget_and_join_loop
-            ):
-                self._time_controls.data_grid.clear_selections()
-                self._time_controls.data_grid.clear_bookmarks()
-                self._time_controls.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Break indentity of selected and bookmarked time control aliases.
+    _time_break = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_time_break,
+        "_is_time_tab_visible",
+        "_time_controls",
+        "break_selected",
+        "Break time control aliases",
+    )
 
-    def _time_split(self):
-        """Split identity of all aliases of selected time control."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_time_split
-        ):
-            return
-        if not self._is_time_tab_visible(
-            EventSpec.menu_other_time_split[1], "Split all time controls"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._time_controls.split_all(
-                self._update_widget_and_join_loop
-            ):
-                self._time_controls.data_grid.clear_selections()
-                self._time_controls.data_grid.clear_bookmarks()
-                self._time_controls.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Split identity of all aliases of selected time control.
+    _time_split = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_time_split,
+        "_is_time_tab_visible",
+        "_time_controls",
+        "split_all",
+        "Split all time controls",
+    )
 
-    def _time_change(self):
-        """Change time control alias used as time control identity."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_time_change
-        ):
-            return
-        if not self._is_time_tab_visible(
-            EventSpec.menu_other_time_change[1], "Change time control identity"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._time_controls.change_identity(
-                self._update_widget_and_join_loop
-            ):
-                self._time_controls.data_grid.clear_selections()
-                self._time_controls.data_grid.clear_bookmarks()
-                self._time_controls.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Change time control alias used as time control identity.
+    _time_change = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_time_change,
+        "_is_time_tab_visible",
+        "_time_controls",
+        "change_identity",
+        "Change time control identity",
+    )
 
     def _is_mode_tab_visible(self, title, prefix):
         """Return True if mode tab is visible or False if not."""
@@ -2159,81 +2128,45 @@ class Calculator(Bindings):
             self._modes, self._modes_tab, "playing modes", title, prefix
         )
 
-    def _mode_identify(self):
-        """Identify bookmarked playing modes as selected playing mode."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_mode_identify
-        ):
-            return
-        if not self._is_mode_tab_visible(
-            EventSpec.menu_other_mode_identify[1], "Identify playing mode"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._modes.identify(self._update_widget_and_join_loop):
-                self._modes.data_grid.clear_selections()
-                self._modes.data_grid.clear_bookmarks()
-                self._modes.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Identify bookmarked playing modes as selected playing mode.
+    _mode_identify = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_mode_identify,
+        "_is_mode_tab_visible",
+        "_modes",
+        "identify",
+        "Identify playing mode",
+    )
 
-    def _mode_break(self):
-        """Break indentity of selected and bookmarked playing mode aliases."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_mode_break
-        ):
-            return
-        if not self._is_mode_tab_visible(
-            EventSpec.menu_other_mode_break[1], "Break playing mode aliases"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._modes.break_selected(self._update_widget_and_join_loop):
-                self._modes.data_grid.clear_selections()
-                self._modes.data_grid.clear_bookmarks()
-                self._modes.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Break indentity of selected and bookmarked playing mode aliases.
+    _mode_break = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_mode_break,
+        "_is_mode_tab_visible",
+        "_modes",
+        "break_selected",
+        "Break playing mode aliases",
+    )
 
-    def _mode_split(self):
-        """Split indentity of playing modes of selected playing mode alias."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_mode_split
-        ):
-            return
-        if not self._is_mode_tab_visible(
-            EventSpec.menu_other_mode_split[1], "Split all playing modes"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._modes.split_all(self._update_widget_and_join_loop):
-                self._modes.data_grid.clear_selections()
-                self._modes.data_grid.clear_bookmarks()
-                self._modes.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Split indentity of playing modes of selected playing mode alias.
+    _mode_split = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_mode_split,
+        "_is_mode_tab_visible",
+        "_modes",
+        "split_all",
+        "Split all playing modes",
+    )
 
-    def _mode_change(self):
-        """Change playing mode alias used as playing mode identity."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_mode_change
-        ):
-            return
-        if not self._is_mode_tab_visible(
-            EventSpec.menu_other_mode_change[1], "Change playing mode identity"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._modes.change_identity(self._update_widget_and_join_loop):
-                self._modes.data_grid.clear_selections()
-                self._modes.data_grid.clear_bookmarks()
-                self._modes.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Change playing mode alias used as playing mode identity.
+    _mode_change = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_mode_change,
+        "_is_mode_tab_visible",
+        "_modes",
+        "change_identity",
+        "Change playing mode identity",
+    )
 
     def _is_termination_tab_visible(self, title, prefix):
         """Return True if termination tab is visible or False if not."""
@@ -2245,88 +2178,45 @@ class Calculator(Bindings):
             prefix,
         )
 
-    def _termination_identify(self):
-        """Identify bookmarked terminations as selected termination."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_termination_identify
-        ):
-            return
-        if not self._is_termination_tab_visible(
-            EventSpec.menu_other_termination_identify[1],
-            "Identify playing termination",
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._terminations.identify(self._update_widget_and_join_loop):
-                self._terminations.data_grid.clear_selections()
-                self._terminations.data_grid.clear_bookmarks()
-                self._terminations.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Identify bookmarked terminations as selected termination.
+    _termination_identify = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_termination_identify,
+        "_is_termination_tab_visible",
+        "_terminations",
+        "identify",
+        "Identify playing termination",
+    )
 
-    def _termination_break(self):
-        """Break indentity of selected and bookmarked termination aliases."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_termination_break
-        ):
-            return
-        if not self._is_termination_tab_visible(
-            EventSpec.menu_other_termination_break[1],
-            "Break termination aliases",
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._terminations.break_selected(
-                self._update_widget_and_join_loop
-            ):
-                self._terminations.data_grid.clear_selections()
-                self._terminations.data_grid.clear_bookmarks()
-                self._terminations.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Break indentity of selected and bookmarked termination aliases.
+    _termination_break = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_termination_break,
+        "_is_termination_tab_visible",
+        "_terminations",
+        "break_selected",
+        "Break termination aliases",
+    )
 
-    def _termination_split(self):
-        """Split indentity of terminations of selected termination alias."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_termination_split
-        ):
-            return
-        if not self._is_termination_tab_visible(
-            EventSpec.menu_other_termination_split[1], "Split all terminations"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._terminations.split_all(self._update_widget_and_join_loop):
-                self._terminations.data_grid.clear_selections()
-                self._terminations.data_grid.clear_bookmarks()
-                self._terminations.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Split indentity of terminations of selected termination alias.
+    _termination_split = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_termination_split,
+        "_is_termination_tab_visible",
+        "_terminations",
+        "split_all",
+        "Split all terminations",
+    )
 
-    def _termination_change(self):
-        """Change termination alias used as termination identity."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_termination_change
-        ):
-            return
-        if not self._is_termination_tab_visible(
-            EventSpec.menu_other_termination_change[1],
-            "Change termination identity",
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._terminations.change_identity(
-                self._update_widget_and_join_loop
-            ):
-                self._terminations.data_grid.clear_selections()
-                self._terminations.data_grid.clear_bookmarks()
-                self._terminations.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Change termination alias used as termination identity.
+    _termination_change = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_termination_change,
+        "_is_termination_tab_visible",
+        "_terminations",
+        "change_identity",
+        "Change termination identity",
+    )
 
     def _is_player_type_tab_visible(self, title, prefix):
         """Return True if player type tab is visible or False if not."""
@@ -2338,88 +2228,45 @@ class Calculator(Bindings):
             prefix,
         )
 
-    def _player_type_identify(self):
-        """Identify bookmarked player types as selected player type."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_playertype_identify
-        ):
-            return
-        if not self._is_player_type_tab_visible(
-            EventSpec.menu_other_playertype_identify[1],
-            "Identify playing player type",
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._player_types.identify(self._update_widget_and_join_loop):
-                self._player_types.data_grid.clear_selections()
-                self._player_types.data_grid.clear_bookmarks()
-                self._player_types.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Identify bookmarked player types as selected player type.
+    _player_type_identify = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_playertype_identify,
+        "_is_player_type_tab_visible",
+        "_player_types",
+        "identify",
+        "Identify playing player type",
+    )
 
-    def _player_type_break(self):
-        """Break indentity of selected and bookmarked player type aliases."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_playertype_break
-        ):
-            return
-        if not self._is_player_type_tab_visible(
-            EventSpec.menu_other_playertype_break[1],
-            "Break player type aliases",
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._player_types.break_selected(
-                self._update_widget_and_join_loop
-            ):
-                self._player_types.data_grid.clear_selections()
-                self._player_types.data_grid.clear_bookmarks()
-                self._player_types.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Break indentity of selected and bookmarked player type aliases.
+    _player_type_break = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_playertype_break,
+        "_is_player_type_tab_visible",
+        "_player_types",
+        "break_selected",
+        "Break player type aliases",
+    )
 
-    def _player_type_split(self):
-        """Split indentity of player types of selected player type alias."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_playertype_split
-        ):
-            return
-        if not self._is_player_type_tab_visible(
-            EventSpec.menu_other_playertype_split[1], "Split all player types"
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._player_types.split_all(self._update_widget_and_join_loop):
-                self._player_types.data_grid.clear_selections()
-                self._player_types.data_grid.clear_bookmarks()
-                self._player_types.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Split indentity of player types of selected player type alias.
+    _player_type_split = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_playertype_split,
+        "_is_player_type_tab_visible",
+        "_player_types",
+        "split_all",
+        "Split all player types",
+    )
 
-    def _player_type_change(self):
-        """Change player type alias used as player type identity."""
-        if not self._set_lock_to_eventspec_name(
-            EventSpec.menu_other_playertype_change
-        ):
-            return
-        if not self._is_player_type_tab_visible(
-            EventSpec.menu_other_playertype_change[1],
-            "Change player type identity",
-        ):
-            return
-        self._apply_lock()
-        try:
-            if self._player_types.change_identity(
-                self._update_widget_and_join_loop
-            ):
-                self._player_types.data_grid.clear_selections()
-                self._player_types.data_grid.clear_bookmarks()
-                self._player_types.data_grid.fill_view_with_top()
-        finally:
-            self._clear_lock()
+    # Change player type alias used as player type identity.
+    _player_type_change = functools.partialmethod(
+        _other_identity_action,
+        EventSpec.menu_other_playertype_change,
+        "_is_player_type_tab_visible",
+        "_player_types",
+        "change_identity",
+        "Change player type identity",
+    )
 
     def _calculate(self):
         """Calulate player performances from games selected by rule."""
@@ -2427,12 +2274,12 @@ class Calculator(Bindings):
             EventSpec.menu_calculate_calculate
         ):
             return
-        tab = self._selectors_apply(EventSpec.menu_calculate_calculate)
-        if not tab:
+        rule = self._selectors_apply(EventSpec.menu_calculate_calculate)[1]
+        if rule is None:
             return
         self._apply_lock()
         try:
-            self._rule_tabs[tab].calulate_performances_for_rule(
+            rule.calulate_performances_for_rule(
                 self._update_widget_and_join_loop
             )
         finally:
@@ -2443,8 +2290,8 @@ class Calculator(Bindings):
         """Save report in active report tab."""
         if not self._set_lock_to_eventspec_name(menu_event_spec):
             return
-        tab = report_type(menu_event_spec)
-        if not tab:
+        frame = report_type(menu_event_spec)[1]
+        if frame is None:
             return
         directory = os.path.join(self.database_folder, REPORT_DIRECTORY)
         if not os.path.isdir(directory):
@@ -2483,20 +2330,6 @@ class Calculator(Bindings):
                 ),
             )
             return
-        if tab in self._report_tabs:
-            frame = self._report_tabs[tab]
-        elif tab in self._rule_tabs:
-            frame = self._rule_tabs[tab]
-        elif tab in self._remove_pgn_tabs:
-            frame = self._remove_pgn_tabs[tab]
-        else:
-            # Should have been caught by 'tab' test near top of method.
-            tkinter.messagebox.showinfo(
-                parent=self.widget,
-                title=menu_event_spec[1],
-                message="Unable to locate tab text to save",
-            )
-            return
         with open(filename, mode="w", encoding="utf-8") as file:
             file.write(frame.report_text.get("1.0", tkinter.END))
         tkinter.messagebox.showinfo(
@@ -2524,44 +2357,63 @@ class Calculator(Bindings):
         """Close report on apply identities."""
         if not self._set_lock_to_eventspec_name(EventSpec.menu_report_close):
             return
-        tab = self._report_apply(EventSpec.menu_report_close)
-        if not tab:
+        tab = self._report_apply(EventSpec.menu_report_close)[0]
+        if tab is None:
             return
         self._notebook.forget(tab)
-        if tab in self._report_tabs:
-            del self._report_tabs[tab]
-        elif tab in self._rule_tabs:
-            del self._rule_tabs[tab]
-        elif tab in self._remove_pgn_tabs:
-            del self._remove_pgn_tabs[tab]
+        tabs = self._tab_owners.pop(tab)
+        del tabs[tab]
 
     def _report_apply(self, menu_event_spec):
-        """Return tab if a selection rule tab is visible, False otherwise."""
+        """Return (tab, report) for visible report or selection rule tab.
+
+        Return (None, None) if a report or selection rule tab is not visible.
+
+        """
         if self._notebook is None:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
                 title=menu_event_spec[1],
                 message="Reports not available at present",
             )
-            return False
+            return None, None
         tab = self._notebook.select()
-        if (
-            tab not in self._report_tabs
-            and tab not in self._rule_tabs
-            and tab not in self._remove_pgn_tabs
-        ):
-            tkinter.messagebox.showinfo(
-                parent=self.widget,
-                title=menu_event_spec[1],
-                message="".join(
-                    (
-                        "A report is ",
-                        "not the visible tab at present",
-                    )
-                ),
-            )
-            return False
-        return tab
+        tabs = self._tab_owners.get(tab)
+        if tabs is not None:
+            return tab, tabs[tab]
+        tkinter.messagebox.showinfo(
+            parent=self.widget,
+            title=menu_event_spec[1],
+            message=_REPORT_TAB_NOT_VISIBLE,
+        )
+        return None, None
+
+    def _register_tab(self, tabs, frame, tab):
+        """Return tab name of frame after noting tab in tabs under name.
+
+        tabs is one of the dicts of report or selection rule tabs.
+
+        """
+        tab_name = self._tab_name(frame)
+        tabs[tab_name] = tab
+        self._tab_owners[tab_name] = tabs
+        return tab_name
+
+    def _tab_name(self, frame):
+        """Return the notebook tab name of frame.
+
+        After the first tkinter.TclError from winfo_pathname the name is
+        got from workarounds.winfo_pathname without trying winfo_pathname.
+
+        """
+        if not self._winfo_pathname_fails:
+            try:
+                return frame.winfo_pathname(frame.winfo_id())
+            except tkinter.TclError as exc:
+                tab_name = workarounds.winfo_pathname(frame, exc)
+            self._winfo_pathname_fails = True
+            return tab_name
+        return workarounds.winfo_pathname(frame, None)
 
     def _add_report_to_notebook(
         self, import_file, reportclass, answer, message, title
@@ -2572,11 +2424,10 @@ class Calculator(Bindings):
         self._notebook.add(
             frame, text="Report " + os.path.basename(import_file)
         )
-        try:
-            self._report_tabs[frame.winfo_pathname(frame.winfo_id())] = tab
-        except tkinter.TclError as exc:
-            self._report_tabs[workarounds.winfo_pathname(frame, exc)] = tab
-        tab.populate(answer["report"])
+        tab_name = self._register_tab(self._report_tabs, frame, tab)
+
+        # The report is populated when the tab is first made visible.
+        self._unpopulated_reports[tab_name] = answer["report"]
         if answer["report"].messages_exist:
             tkinter.messagebox.showinfo(
                 parent=self.widget,
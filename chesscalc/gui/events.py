@@ -5,24 +5,57 @@
 """List the events in the database."""
 
 import tkinter
+import tkinter.messagebox
 import os
 import datetime
 
-from solentware_bind.gui.bindings import Bindings
-
 from . import eventsgrid
+from . import gridactions
 from .eventspec import EventSpec
 from ..core import identify_event
 from ..core import export
 from ..shared import task
 from .. import REPORT_DIRECTORY
 
+_IDENTIFY_TITLE = EventSpec.menu_other_event_identify[1]
+_BREAK_TITLE = EventSpec.menu_other_event_break[1]
+_SPLIT_TITLE = EventSpec.menu_other_event_split[1]
+_CHANGE_TITLE = EventSpec.menu_other_event_change[1]
+_EXPORT_PERSONS_TITLE = EventSpec.menu_other_event_export_persons[1]
+
+# Dialogue messages without variable parts.
+_NO_EVENT_SELECTED = "No event is selected"
+_EVENTS_ARE_BOOKMARKED = "Events are bookmarked so no changes done"
+_NO_EVENTS_BOOKMARKED = "No events are bookmarked so no changes done"
+_SELECTION_IS_BOOKMARK = "Selection and bookmark is same so no changes done"
+_SELECTION_IS_BOOKMARKED = (
+    "Selection is one of bookmarked events so no changes done"
+)
+_SELECTION_MESSAGES = (
+    _NO_EVENT_SELECTED,
+    _EVENTS_ARE_BOOKMARKED,
+    _NO_EVENTS_BOOKMARKED,
+    _SELECTION_IS_BOOKMARK,
+    _SELECTION_IS_BOOKMARKED,
+)
+_NO_EVENTS_FOR_EXPORT = "No events are selected or bookmarked"
+_EXPORT_DATA_NOT_EXTRACTED = (
+    "Export of event persons failed\n\nUnable to extract data"
+)
+_EXPORT_CANCELLED = "Export of event persons cancelled"
+_NOT_ATTACHED_TO_DATABASE = (
+    "Events list is not attached to database at present"
+)
+_NOT_ATTACHED_TO_INDEX = (
+    "Events list is not attached to database index at present"
+)
+
 
 class EventsError(Exception):
     """Raise exception in events module."""
 
 
-class Events(Bindings):
+class Events(gridactions.GridActions):
     """Define widgets which list events of games."""
 
     def __init__(self, master, database):
@@ -44,195 +77,63 @@ class Events(Bindings):
 
     def identify(self, update_widget_and_join_loop):
         """Identify bookmarked events as selected event."""
-        title = EventSpec.menu_other_event_identify[1]
-        database = self.get_database(title)
+        database, events_sel, events_bmk = self._validate_selection(
+            _IDENTIFY_TITLE, True, _SELECTION_MESSAGES
+        )
         if not database:
-            return None
-        events_sel = self._events_grid.selection
-        events_bmk = self._events_grid.bookmarks
-        if len(events_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No event is selected",
-            )
-            return False
-        if len(events_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No events are bookmarked so no changes done",
-            )
-            return False
-        if events_bmk == events_sel:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Selection and bookmark is same so no changes done",
-            )
-            return False
-        new = set(events_bmk)
-        if new.intersection(events_sel):
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Selection is one of bookmarked events ",
-                        "so no changes done",
-                    )
-                ),
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            _IDENTIFY_TITLE,
             identify_event.identify,
-            (database, new, events_sel, answer),
+            database,
+            (events_bmk, events_sel),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def break_selected(self, update_widget_and_join_loop):
         """Undo identification of bookmarked events as selection event."""
-        title = EventSpec.menu_other_event_break[1]
-        database = self.get_database(title)
+        database, events_sel, events_bmk = self._validate_selection(
+            _BREAK_TITLE, True, _SELECTION_MESSAGES
+        )
         if not database:
-            return None
-        events_sel = self._events_grid.selection
-        events_bmk = self._events_grid.bookmarks
-        if len(events_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No event is selected",
-            )
-            return False
-        if len(events_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No events are bookmarked so no changes done",
-            )
-            return False
-        if events_bmk == events_sel:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Selection and bookmark is same so no changes done",
-            )
-            return False
-        new = set(events_bmk)
-        if new.intersection(events_sel):
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Selection is one of bookmarked events ",
-                        "so no changes done",
-                    )
-                ),
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            _BREAK_TITLE,
             identify_event.break_bookmarked_aliases,
-            (database, new, events_sel, answer),
+            database,
+            (events_bmk, events_sel),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def split_all(self, update_widget_and_join_loop):
         """Undo identification of all aliases of selected event."""
-        title = EventSpec.menu_other_event_split[1]
-        database = self.get_database(title)
+        database, events_sel = self._validate_selection(
+            _SPLIT_TITLE, False, _SELECTION_MESSAGES
+        )[:2]
         if not database:
-            return None
-        events_sel = self._events_grid.selection
-        events_bmk = self._events_grid.bookmarks
-        if len(events_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No event is selected",
-            )
-            return False
-        if len(events_bmk) != 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Events are bookmarked so no changes done",
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            _SPLIT_TITLE,
             identify_event.split_aliases,
-            (database, events_sel, answer),
+            database,
+            (events_sel,),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def change_identity(self, update_widget_and_join_loop):
         """Undo identification of all aliases of selected event."""
-        title = EventSpec.menu_other_event_change[1]
-        database = self.get_database(title)
+        database, events_sel = self._validate_selection(
+            _CHANGE_TITLE, False, _SELECTION_MESSAGES
+        )[:2]
         if not database:
-            return None
-        events_sel = self._events_grid.selection
-        events_bmk = self._events_grid.bookmarks
-        if len(events_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No event is selected",
-            )
-            return False
-        if len(events_bmk) != 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Events are bookmarked so no changes done",
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            _CHANGE_TITLE,
             identify_event.change_aliases,
-            (database, events_sel, answer),
+            database,
+            (events_sel,),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def _export_players_in_selected_events(
         self, database, events_bmk, events_sel, answer
@@ -240,59 +141,29 @@ class Events(Bindings):
         """Prepare player data for export."""
         exporter = export.ExportEventPersons(database, events_bmk, events_sel)
         answer["status"] = exporter.prepare_export_data()
-        if answer["status"].error_message is None:
-            answer["serialized_data"] = exporter.export_repr()
+        answer["exporter"] = exporter
 
     def export_players_in_selected_events(self, update_widget_and_join_loop):
         """Export players for selection and bookmarked events."""
-        title = EventSpec.menu_other_event_export_persons[1]
+        title = _EXPORT_PERSONS_TITLE
         database = self.get_database(title)
         if not database:
             return None
-        events_sel = self._events_grid.selection
-        events_bmk = self._events_grid.bookmarks
+        events_grid = self._events_grid
+        frame = events_grid.frame
+        events_sel = events_grid.selection
+        events_bmk = events_grid.bookmarks
         if len(events_sel) + len(events_bmk) == 0:
             tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No events are selected or bookmarked",
-            )
-            return False
-        answer = {"status": None, "serialized_data": None}
-        task.Task(
-            database,
-            self._export_players_in_selected_events,
-            (database, events_bmk, events_sel, answer),
-            update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["status"] is None:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                message="\n\n".join(
-                    (
-                        "Export of event persons failed",
-                        "Unable to extract data",
-                    )
-                ),
-                title=title,
-            )
-            return False
-        if answer["status"].error_message is not None:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                message="\n\n".join(
-                    (
-                        "Export of event persons failed",
-                        answer["status"].error_message,
-                    )
-                ),
+                parent=frame,
                 title=title,
+                message=_NO_EVENTS_FOR_EXPORT,
             )
             return False
         directory = os.path.join(database.home_directory, REPORT_DIRECTORY)
         if not os.path.isdir(directory):
             tkinter.messagebox.showinfo(
-                parent=self.frame,
+                parent=frame,
                 title=title,
                 message="".join(
                     (
@@ -314,42 +185,80 @@ class Events(Bindings):
                     )
                 ),
             )
-            if os.path.exists(export_file):
-                if not tkinter.messagebox.askyesno(
-                    parent=self.frame,
+            if not os.path.exists(export_file):
+                break
+            if not tkinter.messagebox.askyesno(
+                parent=frame,
+                title=title,
+                message="".join(
+                    (
+                        os.path.basename(export_file),
+                        " exists\n\nPlease try again",
+                        " to get a new timestamp",
+                    )
+                ),
+            ):
+                tkinter.messagebox.showinfo(
+                    parent=frame,
+                    message=_EXPORT_CANCELLED,
                     title=title,
-                    message="".join(
-                        (
-                            os.path.basename(export_file),
-                            " exists\n\nPlease try again",
-                            " to get a new timestamp",
-                        )
-                    ),
-                ):
-                    tkinter.messagebox.showinfo(
-                        parent=self.frame,
-                        message="Export of event persons cancelled",
-                        title=title,
+                )
+                return False
+        answer = {"status": None, "exporter": None}
+        task.Task(
+            database,
+            self._export_players_in_selected_events,
+            (database, events_bmk, events_sel, answer),
+            update_widget_and_join_loop,
+        ).start_and_join()
+        if answer["status"] is None:
+            tkinter.messagebox.showinfo(
+                parent=frame,
+                message=_EXPORT_DATA_NOT_EXTRACTED,
+                title=title,
+            )
+            return False
+        if answer["status"].error_message is not None:
+            tkinter.messagebox.showinfo(
+                parent=frame,
+                message="\n\n".join(
+                    (
+                        "Export of event persons failed",
+                        answer["status"].error_message,
                     )
-                    return False
-                continue
-            task.Task(
-                database,
-                export.write_export_file,
-                (export_file, answer["serialized_data"]),
-                update_widget_and_join_loop,
-            ).start_and_join()
+                ),
+                title=title,
+            )
+            return False
+        task.Task(
+            None,
+            answer["exporter"].write_export,
+            (export_file,),
+            update_widget_and_join_loop,
+        ).start_and_join()
+        if answer["exporter"].error_message is not None:
             tkinter.messagebox.showinfo(
-                parent=self.frame,
-                message="".join(
+                parent=frame,
+                message="\n\n".join(
                     (
-                        "Persons in selected events exported to\n\n",
-                        export_file,
+                        "Export of event persons failed",
+                        answer["exporter"].error_message,
                     )
                 ),
                 title=title,
             )
-            return True
+            return False
+        tkinter.messagebox.showinfo(
+            parent=frame,
+            message="".join(
+                (
+                    "Persons in selected events exported to\n\n",
+                    export_file,
+                )
+            ),
+            title=title,
+        )
+        return True
 
     def get_database(self, title):
         """Return database if events list is attached to database.
@@ -362,12 +271,7 @@ class Events(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.frame,
                 title=title,
-                message="".join(
-                    (
-                        "Events list ",
-                        "is not attached to database at present",
-                    )
-                ),
+                message=_NOT_ATTACHED_TO_DATABASE,
             )
             return False
         events_db = events_ds.dbhome
@@ -375,12 +279,7 @@ class Events(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.frame,
                 title=title,
-                message="".join(
-                    (
-                        "Events list ",
-                        "is not attached to database index at present",
-                    )
-                ),
+                message=_NOT_ATTACHED_TO_INDEX,
             )
             return False
         return events_db
@@ -33,29 +33,30 @@ class EventsRow(eventrecord.EventDBrecord, datarow.DataRow):
         )
     ]
 
+    row_specification = [
+        {
+            datarow.WIDGET: tkinter.Label,
+            datarow.WIDGET_CONFIGURE: {"anchor": anchor},
+            datarow.GRID_CONFIGURE: {
+                "column": column,
+                "sticky": tkinter.EW,
+            },
+            datarow.ROW: 0,
+        }
+        for column, anchor in (
+            (0, tkinter.CENTER),
+            (1, tkinter.CENTER),
+            (2, tkinter.CENTER),
+            (3, tkinter.CENTER),
+            (4, tkinter.CENTER),
+            (5, tkinter.CENTER),
+        )
+    ]
+
     def __init__(self, database=None):
         """Extend, define the data displayed from the Event record."""
         super().__init__()
         self.set_database(database)
-        self.row_specification = [
-            {
-                datarow.WIDGET: tkinter.Label,
-                datarow.WIDGET_CONFIGURE: {"anchor": anchor},
-                datarow.GRID_CONFIGURE: {
-                    "column": column,
-                    "sticky": tkinter.EW,
-                },
-                datarow.ROW: 0,
-            }
-            for column, anchor in (
-                (0, tkinter.CENTER),
-                (1, tkinter.CENTER),
-                (2, tkinter.CENTER),
-                (3, tkinter.CENTER),
-                (4, tkinter.CENTER),
-                (5, tkinter.CENTER),
-            )
-        ]
 
     def grid_row(self, **kargs):
         """Return tuple of instructions to create row.
@@ -64,14 +65,20 @@ class EventsRow(eventrecord.EventDBrecord, datarow.DataRow):
 
         """
         value = self.value
+        event = value.event
+        eventdate = value.eventdate
+        section = value.section
+        stage = value.stage
+        alias = value.alias
+        identity = value.identity
         return super().grid_row(
             textitems=(
-                value.event if value.event is not None else "",
-                value.eventdate if value.eventdate is not None else "",
-                value.section if value.section is not None else "",
-                value.stage if value.stage is not None else "",
-                value.alias if value.alias is not None else "",
-                value.identity if value.identity is not None else "",
+                "" if event is None else event,
+                "" if eventdate is None else eventdate,
+                "" if section is None else section,
+                "" if stage is None else stage,
+                "" if alias is None else alias,
+                "" if identity is None else identity,
             ),
             **kargs
         )
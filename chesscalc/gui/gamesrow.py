@@ -49,45 +49,46 @@ class GamesRow(gamerecord.GameDBrecord, datarow.DataRow):
         )
     ]
 
+    row_specification = [
+        {
+            datarow.WIDGET: tkinter.Label,
+            datarow.WIDGET_CONFIGURE: {"anchor": anchor},
+            datarow.GRID_CONFIGURE: {
+                "column": column,
+                "sticky": tkinter.EW,
+            },
+            datarow.ROW: 0,
+        }
+        for column, anchor in (
+            (0, tkinter.CENTER),
+            (1, tkinter.CENTER),
+            (2, tkinter.CENTER),
+            (3, tkinter.CENTER),
+            (4, tkinter.CENTER),
+            (5, tkinter.CENTER),
+            (6, tkinter.CENTER),
+            (7, tkinter.CENTER),
+            (8, tkinter.CENTER),
+            (9, tkinter.CENTER),
+            (10, tkinter.CENTER),
+            (11, tkinter.CENTER),
+            (12, tkinter.CENTER),
+            (13, tkinter.CENTER),
+            (14, tkinter.CENTER),
+            (15, tkinter.CENTER),
+            (16, tkinter.CENTER),
+            (17, tkinter.CENTER),
+            (18, tkinter.CENTER),
+            (19, tkinter.CENTER),
+            (20, tkinter.CENTER),
+            (21, tkinter.CENTER),
+        )
+    ]
+
     def __init__(self, database=None):
         """Extend, define the data displayed from the Game record."""
         super().__init__()
         self.set_database(database)
-        self.row_specification = [
-            {
-                datarow.WIDGET: tkinter.Label,
-                datarow.WIDGET_CONFIGURE: {"anchor": anchor},
-                datarow.GRID_CONFIGURE: {
-                    "column": column,
-                    "sticky": tkinter.EW,
-                },
-                datarow.ROW: 0,
-            }
-            for column, anchor in (
-                (0, tkinter.CENTER),
-                (1, tkinter.CENTER),
-                (2, tkinter.CENTER),
-                (3, tkinter.CENTER),
-                (4, tkinter.CENTER),
-                (5, tkinter.CENTER),
-                (6, tkinter.CENTER),
-                (7, tkinter.CENTER),
-                (8, tkinter.CENTER),
-                (9, tkinter.CENTER),
-                (10, tkinter.CENTER),
-                (11, tkinter.CENTER),
-                (12, tkinter.CENTER),
-                (13, tkinter.CENTER),
-                (14, tkinter.CENTER),
-                (15, tkinter.CENTER),
-                (16, tkinter.CENTER),
-                (17, tkinter.CENTER),
-                (18, tkinter.CENTER),
-                (19, tkinter.CENTER),
-                (20, tkinter.CENTER),
-                (21, tkinter.CENTER),
-            )
-        ]
 
     def grid_row(self, **kargs):
         """Return tuple of instructions to create row.
@@ -95,32 +96,32 @@ class GamesRow(gamerecord.GameDBrecord, datarow.DataRow):
         Create textitems argument for GamesRow instance.
 
         """
-        pgn_headers = self.value.headers
-        reference = self.value.reference
+        get_tag = self.value.headers.get
+        get_reference = self.value.reference.get
         return super().grid_row(
             textitems=(
-                pgn_headers.get(constants.TAG_EVENT, ""),
-                pgn_headers.get(constants.TAG_EVENTDATE, ""),
-                pgn_headers.get(constants.TAG_SECTION, ""),
-                pgn_headers.get(constants.TAG_STAGE, ""),
-                pgn_headers.get(constants.TAG_DATE, ""),
-                pgn_headers.get(constants.TAG_WHITE, ""),
-                pgn_headers.get(constants.TAG_WHITEFIDEID, ""),
-                pgn_headers.get(constants.TAG_WHITETEAM, ""),
-                pgn_headers.get(constants.TAG_WHITETYPE, ""),
-                pgn_headers.get(constants.TAG_RESULT, ""),
-                pgn_headers.get(constants.TAG_TERMINATION, ""),
-                pgn_headers.get(constants.TAG_BLACK, ""),
-                pgn_headers.get(constants.TAG_BLACKFIDEID, ""),
-                pgn_headers.get(constants.TAG_BLACKTEAM, ""),
-                pgn_headers.get(constants.TAG_BLACKTYPE, ""),
-                pgn_headers.get(constants.TAG_SITE, ""),
-                pgn_headers.get(constants.TAG_ROUND, ""),
-                pgn_headers.get(constants.TAG_BOARD, ""),
-                pgn_headers.get(constants.TAG_TIMECONTROL, ""),
-                pgn_headers.get(constants.TAG_MODE, ""),
-                reference.get(constants.FILE, ""),
-                reference.get(constants.GAME, ""),
+                get_tag(constants.TAG_EVENT, ""),
+                get_tag(constants.TAG_EVENTDATE, ""),
+                get_tag(constants.TAG_SECTION, ""),
+                get_tag(constants.TAG_STAGE, ""),
+                get_tag(constants.TAG_DATE, ""),
+                get_tag(constants.TAG_WHITE, ""),
+                get_tag(constants.TAG_WHITEFIDEID, ""),
+                get_tag(constants.TAG_WHITETEAM, ""),
+                get_tag(constants.TAG_WHITETYPE, ""),
+                get_tag(constants.TAG_RESULT, ""),
+                get_tag(constants.TAG_TERMINATION, ""),
+                get_tag(constants.TAG_BLACK, ""),
+                get_tag(constants.TAG_BLACKFIDEID, ""),
+                get_tag(constants.TAG_BLACKTEAM, ""),
+                get_tag(constants.TAG_BLACKTYPE, ""),
+                get_tag(constants.TAG_SITE, ""),
+                get_tag(constants.TAG_ROUND, ""),
+                get_tag(constants.TAG_BOARD, ""),
+                get_tag(constants.TAG_TIMECONTROL, ""),
+                get_tag(constants.TAG_MODE, ""),
+                get_reference(constants.FILE, ""),
+                get_reference(constants.GAME, ""),
             ),
             **kargs
         )
@@ -0,0 +1,151 @@
+# gridactions.py
+# Copyright 2024 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Provide dialogues and database tasks for actions on grid selections.
+
+The GridActions class is the base class of the classes which apply menu
+actions to the selected and bookmarked items in a DataGrid, such as the
+Events, Modes, Persons, and Players classes.
+
+"""
+
+import tkinter
+import tkinter.messagebox
+
+from solentware_bind.gui.bindings import Bindings
+
+from ..shared import task
+
+
+class GridActions(Bindings):
+    """Validate selection and bookmarks in a grid and apply an action.
+
+    Subclasses provide the frame property, the parent of all dialogues,
+    and the get_database(title) method.  Subclasses which use
+    _validate_selection() or _confirm_single_selection() also provide the
+    data_grid property.
+
+    """
+
+    def _show_problem(self, title, message):
+        """Show information dialogue about the action named title."""
+        tkinter.messagebox.showinfo(
+            parent=self.frame,
+            title=title,
+            message=message,
+        )
+
+    def _validate_selection(self, title, bookmarks_required, messages):
+        """Return (database, selection, bookmarks) if action can be done.
+
+        bookmarks_required is True if the action needs bookmarked items
+        distinct from the selected item, and False if the action needs
+        no items to be bookmarked.  The bookmarks are returned as a set
+        if bookmarks_required is True.
+
+        messages is a tuple of the dialogue messages for no selection,
+        bookmarks present when not allowed, no bookmarks when required,
+        selection same as bookmarks, and selection among bookmarks, in
+        that order.
+
+        The database item is None if the grid is not attached to a
+        database, and False if the selection and bookmarks do not fit
+        the action, after a dialogue indicating the problem.
+
+        """
+        database = self.get_database(title)
+        if not database:
+            return None, None, None
+        (
+            no_selection,
+            are_bookmarked,
+            none_bookmarked,
+            selection_is_bookmark,
+            selection_is_bookmarked,
+        ) = messages
+        data_grid = self.data_grid
+        selection = data_grid.selection
+        bookmarks = data_grid.bookmarks
+        if len(selection) == 0:
+            message = no_selection
+        elif not bookmarks_required:
+            if len(bookmarks) == 0:
+                return database, selection, bookmarks
+            message = are_bookmarked
+        elif len(bookmarks) == 0:
+            message = none_bookmarked
+        else:
+            # Neither list has duplicates so equal lengths and selection
+            # a subset of bookmarks means the two are the same items.
+            bookmarked = set(bookmarks)
+            if len(bookmarks) == len(selection) and bookmarked.issuperset(
+                selection
+            ):
+                message = selection_is_bookmark
+            elif not bookmarked.isdisjoint(selection):
+                message = selection_is_bookmarked
+            else:
+                return database, selection, bookmarked
+        self._show_problem(title, message)
+        return False, None, None
+
+    def _confirm_single_selection(self, title, messages):
+        """Return (database, selection) if action on selection confirmed.
+
+        messages is a tuple of the dialogue messages for no selection,
+        more than one selection, confirmation when items are bookmarked,
+        and confirmation when no items are bookmarked, in that order.
+
+        The database item is None if the grid is not attached to a
+        database, and False if the action is not done, after a dialogue
+        indicating the problem.
+
+        """
+        database = self.get_database(title)
+        if not database:
+            return None, None
+        data_grid = self.data_grid
+        selection = data_grid.selection
+        no_selection, not_one, confirm_bookmarked, confirm = messages
+        if len(selection) == 0:
+            self._show_problem(title, no_selection)
+            return False, None
+        if len(selection) != 1:
+            self._show_problem(title, not_one)
+            return False, None
+        if not tkinter.messagebox.askokcancel(
+            parent=self.frame,
+            title=title,
+            message=(
+                confirm_bookmarked
+                if len(data_grid.bookmarks) != 0
+                else confirm
+            ),
+        ):
+            return False, None
+        return database, selection
+
+    def _do_action(
+        self, title, action, database, arguments, update_widget_and_join_loop
+    ):
+        """Return True if action succeeds on database with arguments.
+
+        action is called as action(database, *arguments, answer) in a
+        task.Task for database, where answer is a dict whose "message"
+        item is set to describe any failure.
+
+        Return False after dialogue reporting the problem otherwise.
+
+        """
+        answer = {"message": None}
+        task.Task(
+            database,
+            action,
+            (database,) + arguments + (answer,),
+            update_widget_and_join_loop,
+        ).start_and_join()
+        if answer["message"]:
+            self._show_problem(title, answer["message"])
+            return False
+        return True
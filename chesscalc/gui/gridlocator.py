@@ -29,6 +29,8 @@ class GridLocator(gridbindings.GridBindings, datagrid.DataGridReadOnly):
         """
         super().__init__(**kwargs)
         self._char = ""
+        self._fill_view_pending = None
+        self._fill_view_cancelled = False
         self.scroller = tkinter.ttk.Entry(master=self.parent)
         self.vsbar.configure(takefocus=tkinter.FALSE)
         self.hsbar.configure(takefocus=tkinter.FALSE)
@@ -38,6 +40,63 @@ class GridLocator(gridbindings.GridBindings, datagrid.DataGridReadOnly):
         self.bind(self.scroller, "<KeyPress>", function=self._note_char)
         self.bind(self.scroller, "<KeyRelease>", function=self._locate_key)
 
+    def reset_view(self, keep_bookmarks=False):
+        """Clear selection and bookmarks and fill view with top record.
+
+        The bookmarks are not cleared if keep_bookmarks is True.
+
+        The selection and bookmark indicators are not removed row by row,
+        as clear_selections() and clear_bookmarks() do, because every row
+        is drawn again by fill_view_with_top().
+
+        The fill is done when idle so several resets in quick succession
+        cause one redraw.  A pending fill is cancelled by bind_off() and
+        scheduled again by bind_on().
+
+        """
+        self.selection = []
+        if not keep_bookmarks:
+            self.bookmarks = []
+        self._schedule_fill_view()
+
+    def _schedule_fill_view(self):
+        """Schedule one fill_view_with_top() call when idle."""
+        if self._fill_view_pending is not None:
+            return
+        self._fill_view_pending = self.frame.after_idle(
+            self.try_command(self._fill_view_after_reset, self.frame)
+        )
+
+    def _fill_view_after_reset(self):
+        """Fill view with top record after reset_view() calls.
+
+        Nothing is done if the grid was destroyed, or detached from its
+        database, after the fill was scheduled.
+
+        """
+        self._fill_view_pending = None
+        if not self.frame.winfo_exists():
+            return
+        datasource = self.datasource
+        if datasource is None or datasource.dbhome is None:
+            return
+        self.fill_view_with_top()
+
+    def bind_off(self):
+        """Extend to cancel a fill scheduled by reset_view()."""
+        super().bind_off()
+        if self._fill_view_pending is not None:
+            self.frame.after_cancel(self._fill_view_pending)
+            self._fill_view_pending = None
+            self._fill_view_cancelled = True
+
+    def bind_on(self):
+        """Extend to schedule again a fill cancelled by bind_off()."""
+        super().bind_on()
+        if self._fill_view_cancelled:
+            self._fill_view_cancelled = False
+            self._schedule_fill_view()
+
     def show_popup_menu_no_row(self, event=None):
         """Override superclass to do nothing."""
         # Added when DataGridBase changed to assume a popup menu is available
@@ -8,21 +8,46 @@ The modes are ways of conducting the game, such as 'over the board' (OTB)
 or 'online'.
 
 """
-import tkinter
 
-from solentware_bind.gui.bindings import Bindings
+import tkinter
+import tkinter.messagebox
 
+from . import gridactions
 from . import modesgrid
 from .eventspec import EventSpec
 from ..core import identify_mode
-from ..shared import task
+
+_IDENTIFY_TITLE = EventSpec.menu_other_mode_identify[1]
+_BREAK_TITLE = EventSpec.menu_other_mode_break[1]
+_SPLIT_TITLE = EventSpec.menu_other_mode_split[1]
+_CHANGE_TITLE = EventSpec.menu_other_mode_change[1]
+
+# Dialogue messages without variable parts.
+_NO_MODE_SELECTED = "No mode is selected"
+_MODES_ARE_BOOKMARKED = "Modes are bookmarked so no changes done"
+_NO_MODES_BOOKMARKED = "No modes are bookmarked so no changes done"
+_SELECTION_IS_BOOKMARK = "Selection and bookmark is same so no changes done"
+_SELECTION_IS_BOOKMARKED = (
+    "Selection is one of bookmarked modes so no changes done"
+)
+_SELECTION_MESSAGES = (
+    _NO_MODE_SELECTED,
+    _MODES_ARE_BOOKMARKED,
+    _NO_MODES_BOOKMARKED,
+    _SELECTION_IS_BOOKMARK,
+    _SELECTION_IS_BOOKMARKED,
+)
+_NOT_ATTACHED_TO_DATABASE = "Modes list is not attached to database at present"
+_NOT_ATTACHED_TO_INDEX = (
+    "Modes list is not attached to database index at present"
+)
 
 
 class ModesError(Exception):
     """Raise exception in modes module."""
 
 
-class Modes(Bindings):
+class Modes(gridactions.GridActions):
     """Define widgets which list modes of games."""
 
     def __init__(self, master, database):
@@ -44,195 +69,67 @@ class Modes(Bindings):
 
     def identify(self, update_widget_and_join_loop):
         """Identify bookmarked modes as selected mode."""
-        title = EventSpec.menu_other_mode_identify[1]
-        database = self.get_database(title)
+        title = _IDENTIFY_TITLE
+        database, modes_sel, new = self._validate_selection(
+            title, True, _SELECTION_MESSAGES
+        )
         if not database:
-            return None
-        modes_sel = self._modes_grid.selection
-        modes_bmk = self._modes_grid.bookmarks
-        if len(modes_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No mode is selected",
-            )
-            return False
-        if len(modes_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No modes are bookmarked so no changes done",
-            )
-            return False
-        if modes_bmk == modes_sel:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Selection and bookmark is same so no changes done",
-            )
-            return False
-        new = set(modes_bmk)
-        if new.intersection(modes_sel):
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Selection is one of bookmarked modes ",
-                        "so no changes done",
-                    )
-                ),
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            title,
             identify_mode.identify,
-            (database, new, modes_sel, answer),
+            database,
+            (new, modes_sel),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def break_selected(self, update_widget_and_join_loop):
         """Undo identification of bookmarked modes as selection."""
-        title = EventSpec.menu_other_mode_break[1]
-        database = self.get_database(title)
+        title = _BREAK_TITLE
+        database, modes_sel, new = self._validate_selection(
+            title, True, _SELECTION_MESSAGES
+        )
         if not database:
-            return None
-        modes_sel = self._modes_grid.selection
-        modes_bmk = self._modes_grid.bookmarks
-        if len(modes_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No mode is selected",
-            )
-            return False
-        if len(modes_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No modes are bookmarked so no changes done",
-            )
-            return False
-        if modes_bmk == modes_sel:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Selection and bookmark is same so no changes done",
-            )
-            return False
-        new = set(modes_bmk)
-        if new.intersection(modes_sel):
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Selection is one of bookmarked modes ",
-                        "so no changes done",
-                    )
-                ),
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            title,
             identify_mode.break_bookmarked_aliases,
-            (database, new, modes_sel, answer),
+            database,
+            (new, modes_sel),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def split_all(self, update_widget_and_join_loop):
         """Undo identification of all aliases of selected mode."""
-        title = EventSpec.menu_other_mode_split[1]
-        database = self.get_database(title)
+        title = _SPLIT_TITLE
+        database, modes_sel = self._validate_selection(
+            title, False, _SELECTION_MESSAGES
+        )[:2]
         if not database:
-            return None
-        modes_sel = self._modes_grid.selection
-        modes_bmk = self._modes_grid.bookmarks
-        if len(modes_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No mode is selected",
-            )
-            return False
-        if len(modes_bmk) != 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Modes are bookmarked so no changes done",
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            title,
             identify_mode.split_aliases,
-            (database, modes_sel, answer),
+            database,
+            (modes_sel,),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def change_identity(self, update_widget_and_join_loop):
         """Undo identification of all aliases of selected mode."""
-        title = EventSpec.menu_other_mode_change[1]
-        database = self.get_database(title)
+        title = _CHANGE_TITLE
+        database, modes_sel = self._validate_selection(
+            title, False, _SELECTION_MESSAGES
+        )[:2]
         if not database:
-            return None
-        modes_sel = self._modes_grid.selection
-        modes_bmk = self._modes_grid.bookmarks
-        if len(modes_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No mode is selected",
-            )
-            return False
-        if len(modes_bmk) != 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="Modes are bookmarked so no changes done",
-            )
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            title,
             identify_mode.change_aliases,
-            (database, modes_sel, answer),
+            database,
+            (modes_sel,),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def get_database(self, title):
         """Return database if modes list is attached to database.
@@ -245,12 +142,7 @@ class Modes(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.frame,
                 title=title,
-                message="".join(
-                    (
-                        "Modes list ",
-                        "is not attached to database at present",
-                    )
-                ),
+                message=_NOT_ATTACHED_TO_DATABASE,
             )
             return False
         modes_db = modes_ds.dbhome
@@ -258,12 +150,7 @@ class Modes(Bindings):
             tkinter.messagebox.showinfo(
                 parent=self.frame,
                 title=title,
-                message="".join(
-                    (
-                        "Modes list ",
-                        "is not attached to database index at present",
-                    )
-                ),
+                message=_NOT_ATTACHED_TO_INDEX,
             )
             return False
         return modes_db
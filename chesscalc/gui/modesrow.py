@@ -30,26 +30,27 @@ class ModesRow(moderecord.ModeDBrecord, datarow.DataRow):
         )
     ]
 
+    row_specification = [
+        {
+            datarow.WIDGET: tkinter.Label,
+            datarow.WIDGET_CONFIGURE: {"anchor": anchor},
+            datarow.GRID_CONFIGURE: {
+                "column": column,
+                "sticky": tkinter.EW,
+            },
+            datarow.ROW: 0,
+        }
+        for column, anchor in (
+            (0, tkinter.CENTER),
+            (1, tkinter.CENTER),
+            (2, tkinter.CENTER),
+        )
+    ]
+
     def __init__(self, database=None):
         """Extend, define the data displayed from the playing Mode record."""
         super().__init__()
         self.set_database(database)
-        self.row_specification = [
-            {
-                datarow.WIDGET: tkinter.Label,
-                datarow.WIDGET_CONFIGURE: {"anchor": anchor},
-                datarow.GRID_CONFIGURE: {
-                    "column": column,
-                    "sticky": tkinter.EW,
-                },
-                datarow.ROW: 0,
-            }
-            for column, anchor in (
-                (0, tkinter.CENTER),
-                (1, tkinter.CENTER),
-                (2, tkinter.CENTER),
-            )
-        ]
 
     def grid_row(self, **kargs):
         """Return tuple of instructions to create row.
@@ -58,11 +59,14 @@ class ModesRow(moderecord.ModeDBrecord, datarow.DataRow):
 
         """
         value = self.value
+        mode = value.mode
+        alias = value.alias
+        identity = value.identity
         return super().grid_row(
             textitems=(
-                value.mode if value.mode is not None else "",
-                value.alias if value.alias is not None else "",
-                value.identity if value.identity is not None else "",
+                "" if mode is None else mode,
+                "" if alias is None else alias,
+                "" if identity is None else identity,
             ),
             **kargs
         )
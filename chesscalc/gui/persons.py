@@ -5,11 +5,11 @@
 """List the persons in the database."""
 
 import tkinter
+import tkinter.messagebox
 import os
 import datetime
 
-from solentware_bind.gui.bindings import Bindings
-
+from . import gridactions
 from . import personsgrid
 from .eventspec import EventSpec
 from ..core import identify_person
@@ -17,12 +17,80 @@ from ..core import export
 from ..shared import task
 from .. import REPORT_DIRECTORY
 
+_BREAK_TITLE = EventSpec.menu_player_break[1]
+_SPLIT_TITLE = EventSpec.menu_player_split[1]
+_CHANGE_TITLE = EventSpec.menu_player_change[1]
+_EXPORT_TITLE = EventSpec.menu_player_export[1]
+
+# Dialogue messages without variable parts.
+_NOTHING_TO_BREAK = "".join(
+    (
+        "No identified person is selected and no aliases are bookmarked to ",
+        "be made new players",
+    )
+)
+_NO_PERSON_SELECTED = "No identified person is selected"
+_NO_ALIASES_BOOKMARKED = "No aliases are bookmarked to be made new players"
+_SELECTION_IS_BOOKMARKED = (
+    "Cannot break associations when selected entry is also bookmarked"
+)
+_NO_PERSON_TO_SPLIT = (
+    "No identified person is selected to split into all aliases"
+)
+_SPLIT_NEEDS_ONE_PERSON = (
+    "Exactly one identified person must be selected to split into all aliases"
+)
+_CONFIRM_SPLIT_IGNORE_BOOKMARKS = "".join(
+    (
+        "The selected identified person will split into all aliases ",
+        "(bookmarks on identified persons are ignored)",
+    )
+)
+_CONFIRM_SPLIT = "The selected identified person will split into all aliases"
+_NO_PERSON_TO_CHANGE = (
+    "No identified person is selected to have identity changed"
+)
+_CHANGE_NEEDS_ONE_PERSON = (
+    "Exactly one identified person must be selected to change identity"
+)
+_CONFIRM_CHANGE_IGNORE_BOOKMARKS = "".join(
+    (
+        "The selected alias will become the identified person (bookmarks on ",
+        "identified persons are ignored)",
+    )
+)
+_CONFIRM_CHANGE = "The selected alias will become the identified person"
+_NO_PERSONS_FOR_EXPORT = "No identified persons are selected or bookmarked"
+_EXPORT_DATA_NOT_EXTRACTED = (
+    "Export of selected persons failed\n\nUnable to extract data"
+)
+_EXPORT_CANCELLED = "Export of persons cancelled"
+_NOT_ATTACHED_TO_DATABASE = (
+    "Identified Players list is not attached to database at present"
+)
+_NOT_ATTACHED_TO_INDEX = (
+    "Identified Players list is not attached to database index at present"
+)
+
+_SPLIT_MESSAGES = (
+    _NO_PERSON_TO_SPLIT,
+    _SPLIT_NEEDS_ONE_PERSON,
+    _CONFIRM_SPLIT_IGNORE_BOOKMARKS,
+    _CONFIRM_SPLIT,
+)
+_CHANGE_MESSAGES = (
+    _NO_PERSON_TO_CHANGE,
+    _CHANGE_NEEDS_ONE_PERSON,
+    _CONFIRM_CHANGE_IGNORE_BOOKMARKS,
+    _CONFIRM_CHANGE,
+)
+
 
 class PersonsError(Exception):
     """Raise exception in persons module."""
 
 
-class Persons(Bindings):
+class Persons(gridactions.GridActions):
     """Define widgets which list persons not identified as a person."""
 
     def __init__(self, master, database):
@@ -44,238 +112,130 @@ class Persons(Bindings):
 
     def break_selected(self, update_widget_and_join_loop):
         """Undo identification of selected players as a person."""
-        title = EventSpec.menu_player_break[1]
+        title = _BREAK_TITLE
         database = self.get_database(title)
         if not database:
             return None
         persons_sel = self._persons_grid.selection
         persons_bmk = self._persons_grid.bookmarks
-        if len(persons_sel) == 0 and len(persons_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "No identified person is selected and no aliases ",
-                        "are bookmarked to be made new players",
-                    )
-                ),
-            )
-            return False
         if len(persons_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No identified person is selected",
-            )
-            return False
-        if len(persons_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "No aliases ",
-                        "are bookmarked to be made new players",
-                    )
-                ),
-            )
-            return False
-        aliases = set(persons_bmk)
-        if persons_sel[0] in aliases:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Cannot break associations when selected entry ",
-                        "is also bookmarked",
-                    )
-                ),
-            )
+            if len(persons_bmk) == 0:
+                message = _NOTHING_TO_BREAK
+            else:
+                message = _NO_PERSON_SELECTED
+        elif len(persons_bmk) == 0:
+            message = _NO_ALIASES_BOOKMARKED
+        elif persons_sel[0] in persons_bmk:
+            message = _SELECTION_IS_BOOKMARKED
+        else:
+            message = None
+        if message is not None:
+            self._show_problem(title, message)
             return False
-        answer = {"message": None}
-        task.Task(
-            database,
+        return self._do_action(
+            title,
             identify_person.break_person_into_picked_players,
-            (database, persons_sel, aliases, answer),
+            database,
+            (persons_sel, tuple(persons_bmk)),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def split_all(self, update_widget_and_join_loop):
         """Undo identification of all player aliases as a person."""
-        title = EventSpec.menu_player_split[1]
-        database = self.get_database(title)
+        title = _SPLIT_TITLE
+        database, persons_sel = self._confirm_single_selection(
+            title, _SPLIT_MESSAGES
+        )
         if not database:
-            return None
-        persons_sel = self._persons_grid.selection
-        persons_bmk = self._persons_grid.bookmarks
-        if len(persons_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "No identified person is selected to split ",
-                        "into all aliases",
-                    )
-                ),
-            )
-            return False
-        if len(persons_sel) != 1:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Exactly one identified person must be selected ",
-                        "to split into all aliases",
-                    )
-                ),
-            )
-            return False
-        if len(persons_bmk) != 0:
-            if not tkinter.messagebox.askokcancel(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "The selected identified person will split into all "
-                        "aliases (bookmarks on identified persons are "
-                        "ignored)",
-                    )
-                ),
-            ):
-                return False
-        elif not tkinter.messagebox.askokcancel(
-            parent=self.frame,
-            title=title,
-            message="".join(
-                (
-                    "The selected identified person will split into all "
-                    "aliases",
-                )
-            ),
-        ):
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
+            return database
+        return self._do_action(
+            title,
             identify_person.split_person_into_all_players,
-            (database, persons_sel, answer),
+            database,
+            (persons_sel,),
             update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
+        )
 
     def change_identity(self, update_widget_and_join_loop):
         """Change identification of all player aliases as a person."""
-        title = EventSpec.menu_player_change[1]
+        title = _CHANGE_TITLE
+        database, persons_sel = self._confirm_single_selection(
+            title, _CHANGE_MESSAGES
+        )
+        if not database:
+            return database
+        return self._do_action(
+            title,
+            identify_person.change_identified_person,
+            database,
+            (persons_sel,),
+            update_widget_and_join_loop,
+        )
+
+    def _export_selected_players(
+        self, database, persons_bmk, persons_sel, answer
+    ):
+        """Prepare player data for export."""
+        exporter = export.ExportPersons(database, persons_bmk, persons_sel)
+        answer["status"] = exporter.prepare_export_data()
+        answer["exporter"] = exporter
+
+    def export_selected_players(self, update_widget_and_join_loop):
+        """Export players for selection and bookmarked events."""
+        title = _EXPORT_TITLE
         database = self.get_database(title)
         if not database:
             return None
         persons_sel = self._persons_grid.selection
         persons_bmk = self._persons_grid.bookmarks
-        if len(persons_sel) == 0:
+        if len(persons_sel) + len(persons_bmk) == 0:
+            self._show_problem(title, _NO_PERSONS_FOR_EXPORT)
+            return False
+        directory = os.path.join(database.home_directory, REPORT_DIRECTORY)
+        if not os.path.isdir(directory):
             tkinter.messagebox.showinfo(
                 parent=self.frame,
                 title=title,
                 message="".join(
                     (
-                        "No identified person is selected to have ",
-                        "identity changed",
+                        directory,
+                        " is not a directory or does not exist\n\n",
+                        "Please create this directory",
                     )
                 ),
             )
-            return False
-        if len(persons_sel) != 1:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
+        while True:
+            export_file = os.path.join(
+                directory,
+                "_".join(
                     (
-                        "Exactly one identified person must be selected ",
-                        "to change identity",
+                        "aliases",
+                        datetime.datetime.now().isoformat(
+                            sep="_", timespec="seconds"
+                        ),
                     )
                 ),
             )
-            return False
-        if len(persons_bmk) != 0:
-            if not tkinter.messagebox.askokcancel(
+            if not os.path.exists(export_file):
+                break
+            if not tkinter.messagebox.askyesno(
                 parent=self.frame,
                 title=title,
                 message="".join(
                     (
-                        "The selected alias will become the identified ",
-                        "person (bookmarks on identified persons are "
-                        "ignored)",
+                        os.path.basename(export_file),
+                        " exists\n\nPlease try again",
+                        " to get a new timestamp",
                     )
                 ),
             ):
+                tkinter.messagebox.showinfo(
+                    parent=self.frame,
+                    message=_EXPORT_CANCELLED,
+                    title=title,
+                )
                 return False
-        elif not tkinter.messagebox.askokcancel(
-            parent=self.frame,
-            title=title,
-            message="".join(
-                ("The selected alias will become the identified ", "person")
-            ),
-        ):
-            return False
-        answer = {"message": None}
-        task.Task(
-            database,
-            identify_person.change_identified_person,
-            (database, persons_sel, answer),
-            update_widget_and_join_loop,
-        ).start_and_join()
-        if answer["message"]:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message=answer["message"],
-            )
-            return False
-        return True
-
-    def _export_selected_players(
-        self, database, persons_bmk, persons_sel, answer
-    ):
-        """Prepare player data for export."""
-        exporter = export.ExportPersons(database, persons_bmk, persons_sel)
-        answer["status"] = exporter.prepare_export_data()
-        if answer["status"].error_message is None:
-            answer["serialized_data"] = exporter.export_repr()
-
-    def export_selected_players(self, update_widget_and_join_loop):
-        """Export players for selection and bookmarked events."""
-        title = EventSpec.menu_player_export[1]
-        database = self.get_database(title)
-        if not database:
-            return None
-        persons_sel = self._persons_grid.selection
-        persons_bmk = self._persons_grid.bookmarks
-        if len(persons_sel) + len(persons_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="No identified persons are selected or bookmarked",
-            )
-            return False
-        answer = {"status": None, "serialized_data": None}
+        answer = {"status": None, "exporter": None}
         task.Task(
             database,
             self._export_selected_players,
@@ -285,12 +245,7 @@ class Persons(Bindings):
         if answer["status"] is None:
             tkinter.messagebox.showinfo(
                 parent=self.frame,
-                message="\n\n".join(
-                    (
-                        "Export of selected persons failed",
-                        "Unable to extract data",
-                    )
-                ),
+                message=_EXPORT_DATA_NOT_EXTRACTED,
                 title=title,
             )
             return False
@@ -306,67 +261,35 @@ class Persons(Bindings):
                 title=title,
             )
             return False
-        directory = os.path.join(database.home_directory, REPORT_DIRECTORY)
-        if not os.path.isdir(directory):
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        directory,
-                        " is not a directory or does not exist\n\n",
-                        "Please create this directory",
-                    )
-                ),
-            )
-        while True:
-            export_file = os.path.join(
-                directory,
-                "_".join(
-                    (
-                        "aliases",
-                        datetime.datetime.now().isoformat(
-                            sep="_", timespec="seconds"
-                        ),
-                    )
-                ),
-            )
-            if os.path.exists(export_file):
-                if not tkinter.messagebox.askyesno(
-                    parent=self.frame,
-                    title=title,
-                    message="".join(
-                        (
-                            os.path.basename(export_file),
-                            " exists\n\nPlease try again",
-                            " to get a new timestamp",
-                        )
-                    ),
-                ):
-                    tkinter.messagebox.showinfo(
-                        parent=self.frame,
-                        message="Export of persons cancelled",
-                        title=title,
-                    )
-                    return False
-                continue
-            task.Task(
-                database,
-                export.write_export_file,
-                (export_file, answer["serialized_data"]),
-                update_widget_and_join_loop,
-            ).start_and_join()
+        task.Task(
+            None,
+            answer["exporter"].write_export,
+            (export_file,),
+            update_widget_and_join_loop,
+        ).start_and_join()
+        if answer["exporter"].error_message is not None:
             tkinter.messagebox.showinfo(
                 parent=self.frame,
-                message="".join(
+                message="\n\n".join(
                     (
-                        "Selected persons exported to\n\n",
-                        export_file,
+                        "Export of selected persons failed",
+                        answer["exporter"].error_message,
                     )
                 ),
                 title=title,
             )
-            return True
+            return False
+        tkinter.messagebox.showinfo(
+            parent=self.frame,
+            message="".join(
+                (
+                    "Selected persons exported to\n\n",
+                    export_file,
+                )
+            ),
+            title=title,
+        )
+        return True
 
     def get_database(self, title):
         """Return database if identified players list is attached to database.
@@ -376,28 +299,10 @@ class Persons(Bindings):
         """
         persons_ds = self._persons_grid.datasource
         if persons_ds is None:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Identified Players list ",
-                        "is not attached to database at present",
-                    )
-                ),
-            )
+            self._show_problem(title, _NOT_ATTACHED_TO_DATABASE)
             return False
         persons_db = persons_ds.dbhome
         if persons_db is None:
-            tkinter.messagebox.showinfo(
-                parent=self.frame,
-                title=title,
-                message="".join(
-                    (
-                        "Identified Players list ",
-                        "is not attached to database index at present",
-                    )
-                ),
-            )
+            self._show_problem(title, _NOT_ATTACHED_TO_INDEX)
             return False
         return persons_db
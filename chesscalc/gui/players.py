@@ -5,21 +5,108 @@
 """List the players in the database."""
 
 import tkinter
+import tkinter.ttk
+import tkinter.messagebox
 
-from solentware_bind.gui.bindings import Bindings
-
+from . import gridactions
 from . import playersgrid
 from . import personsgrid
 from .eventspec import EventSpec
 from ..core import identify_person
 from ..shared import task
 
+_IDENTIFY_TITLE = EventSpec.menu_player_identify[1]
+_MATCH_BY_NAME_TITLE = EventSpec.menu_match_players_by_name[1]
+
+# Dialogue messages without variable parts.
+_NOTHING_TO_IDENTIFY = "".join(
+    (
+        "No new players are selected or bookmarked for identification as a ",
+        "known player",
+    )
+)
+_NO_PLAYER_SELECTED = (
+    "A new or known player must be selected as the known player to be aliased"
+)
+_CONFIRM_ALIAS_KNOWN_PLAYER = "".join(
+    (
+        "The selected and bookmarked new players will become aliases of the ",
+        "selected known player",
+    )
+)
+_CONFIRM_ALIAS_NEW_PLAYER = "".join(
+    (
+        "The selected and bookmarked new players will become aliases of the ",
+        "selected new player",
+    )
+)
+_BOOKMARKS_IGNORED = "".join(
+    (
+        "Bookmarked items are ignored in this action but will be cleared on ",
+        "completion",
+    )
+)
+_NO_NEW_PLAYER_SELECTED = "".join(
+    (
+        "Please select a new player to become a known player (with any of ",
+        "the same name)",
+    )
+)
+_CONFIRM_NAME_ALIAS_KNOWN_PLAYER = "".join(
+    (
+        "The selected new player and any with the same name will become ",
+        "aliases of the selected known player",
+    )
+)
+_CONFIRM_NAME_NEW_PERSON = "".join(
+    (
+        "The selected player and any with the same name will become one ",
+        "known player",
+    )
+)
+_SELECTION_AND_BOOKMARKS_IGNORED = "".join(
+    (
+        "Selection and bookmarked items are ignored in this action but will ",
+        "be cleared on completion",
+    )
+)
+_LISTS_NOT_ATTACHED_TO_DATABASE = "".join(
+    (
+        "New Players and Identified Players lists are not attached to ",
+        "database at present",
+    )
+)
+_NEW_NOT_ATTACHED_TO_DATABASE = (
+    "New Players list is not attached to database at present"
+)
+_IDENTIFIED_NOT_ATTACHED_TO_DATABASE = (
+    "Identified Players list is not attached to database at present"
+)
+_LISTS_NOT_ATTACHED_TO_INDEX = "".join(
+    (
+        "New Players and Identified Players lists are not attached to ",
+        "database indicies at present",
+    )
+)
+_NEW_NOT_ATTACHED_TO_INDEX = (
+    "New Players list is not attached to database index at present"
+)
+_IDENTIFIED_NOT_ATTACHED_TO_INDEX = (
+    "Identified Players list is not attached to database index at present"
+)
+_LISTS_NOT_ATTACHED_TO_SAME_DATABASE = "".join(
+    (
+        "New Players and Identified Players lists are not attached to same ",
+        "database at present",
+    )
+)
+
 
 class PlayersError(Exception):
     """Raise exception in players module."""
 
 
-class Players(Bindings):
+class Players(gridactions.GridActions):
     """Define widgets which list players not identified as a person."""
 
     def __init__(self, master, database):
@@ -61,68 +148,40 @@ class Players(Bindings):
 
     def identify(self, update_widget_and_join_loop):
         """Identify selected new players as a person."""
-        title = EventSpec.menu_player_identify[1]
+        title = _IDENTIFY_TITLE
         database = self.get_database(title)
         if not database:
             return None
         players_sel = self._players_grid.selection
         players_bmk = self._players_grid.bookmarks
         persons_sel = self._persons_grid.selection
-        if len(players_sel) == 0 and len(players_bmk) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "No new players are selected or bookmarked for ",
-                        "identification as a known player",
-                    )
-                ),
-            )
-            return False
-        if len(players_sel) == 0 and len(persons_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "A new or known player must be selected as the ",
-                        "known player to be aliased",
-                    )
-                ),
-            )
-            return False
+        if len(players_sel) == 0:
+            if len(players_bmk) == 0:
+                self._show_problem(title, _NOTHING_TO_IDENTIFY)
+                return False
+            if len(persons_sel) == 0:
+                self._show_problem(title, _NO_PLAYER_SELECTED)
+                return False
         if len(persons_sel) == 1:
             if not tkinter.messagebox.askokcancel(
                 parent=self._players,
                 title=title,
-                message="".join(
-                    (
-                        "The selected and bookmarked new players ",
-                        "will become aliases of the selected known ",
-                        "player",
-                    )
-                ),
+                message=_CONFIRM_ALIAS_KNOWN_PLAYER,
             ):
                 return False
         elif not tkinter.messagebox.askokcancel(
             parent=self._players,
             title=title,
-            message="".join(
-                (
-                    "The selected and bookmarked new players will become ",
-                    "aliases of the selected new player",
-                )
-            ),
+            message=_CONFIRM_ALIAS_NEW_PLAYER,
         ):
             return False
         new = set(players_bmk)
         if len(persons_sel) == 1:
             identified = persons_sel
-            new.update(set(players_sel))
+            new.update(players_sel)
         else:
             identified = players_sel
-            new.difference_update(set(players_sel))
+            new.difference_update(players_sel)
         task.Task(
             database,
             identify_person.identify_players_as_person,
@@ -133,57 +192,28 @@ class Players(Bindings):
 
     def identify_by_name(self, update_widget_and_join_loop):
         """Identify selected new players as persons matching on names."""
-        title = EventSpec.menu_player_identify[1]
+        title = _IDENTIFY_TITLE
         database = self.get_database(title)
         if not database:
             return None
         players_sel = self._players_grid.selection
         persons_sel = self._persons_grid.selection
         if self._players_grid.bookmarks or self._persons_grid.bookmarks:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "Bookmarked items are ignored in this action ",
-                        "but will be cleared on completion",
-                    )
-                ),
-            )
+            self._show_problem(title, _BOOKMARKS_IGNORED)
         if len(players_sel) == 0:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "Please select a new player to become a known ",
-                        "player (with any of the same name)",
-                    )
-                ),
-            )
+            self._show_problem(title, _NO_NEW_PLAYER_SELECTED)
             return False
         if len(persons_sel) == 1:
             if not tkinter.messagebox.askokcancel(
                 parent=self._players,
                 title=title,
-                message="".join(
-                    (
-                        "The selected new player and any with the same ",
-                        "name will become aliases of the selected known ",
-                        "player",
-                    )
-                ),
+                message=_CONFIRM_NAME_ALIAS_KNOWN_PLAYER,
             ):
                 return False
         elif not tkinter.messagebox.askokcancel(
             parent=self._players,
             title=title,
-            message="".join(
-                (
-                    "The selected player and any with the same name ",
-                    "will become one known player",
-                )
-            ),
+            message=_CONFIRM_NAME_NEW_PERSON,
         ):
             return False
         if len(persons_sel) == 1:
@@ -200,7 +230,7 @@ class Players(Bindings):
 
     def match_players_by_name(self, update_widget_and_join_loop):
         """Identify new players with same name as person for all names."""
-        title = EventSpec.menu_match_players_by_name[1]
+        title = _MATCH_BY_NAME_TITLE
         database = self.get_database(title)
         if not database:
             return None
@@ -213,12 +243,7 @@ class Players(Bindings):
             if not tkinter.messagebox.askokcancel(
                 parent=self._players,
                 title=title,
-                message="".join(
-                    (
-                        "Selection and bookmarked items are ignored in this ",
-                        "action but will be cleared on completion",
-                    )
-                ),
+                message=_SELECTION_AND_BOOKMARKS_IGNORED,
             ):
                 return False
         task.Task(
@@ -242,89 +267,23 @@ class Players(Bindings):
         players_ds = self._players_grid.datasource
         persons_ds = self._persons_grid.datasource
         if players_ds is None and persons_ds is None:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "New Players and Identified Players lists ",
-                        "are not attached to database at present",
-                    )
-                ),
-            )
-            return False
-        if players_ds is None:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "New Players list ",
-                        "is not attached to database at present",
-                    )
-                ),
-            )
-            return False
-        if persons_ds is None:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "Identified Players list ",
-                        "is not attached to database at present",
-                    )
-                ),
-            )
-            return False
-        players_db = players_ds.dbhome
-        persons_db = persons_ds.dbhome
-        if players_db is None and persons_db is None:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "New Players and Identified Players lists ",
-                        "are not attached to database indicies at present",
-                    )
-                ),
-            )
-            return False
-        if players_db is None:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "New Players list ",
-                        "is not attached to database index at present",
-                    )
-                ),
-            )
-            return False
-        if persons_db is None:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "Identified Players list ",
-                        "is not attached to database index at present",
-                    )
-                ),
-            )
-            return False
-        if players_db is not persons_db:
-            tkinter.messagebox.showinfo(
-                parent=self._players,
-                title=title,
-                message="".join(
-                    (
-                        "New Players and Identified Players lists ",
-                        "are not attached to same database at present",
-                    )
-                ),
-            )
-            return False
-        return players_db
+            message = _LISTS_NOT_ATTACHED_TO_DATABASE
+        elif players_ds is None:
+            message = _NEW_NOT_ATTACHED_TO_DATABASE
+        elif persons_ds is None:
+            message = _IDENTIFIED_NOT_ATTACHED_TO_DATABASE
+        else:
+            players_db = players_ds.dbhome
+            persons_db = persons_ds.dbhome
+            if players_db is None and persons_db is None:
+                message = _LISTS_NOT_ATTACHED_TO_INDEX
+            elif players_db is None:
+                message = _NEW_NOT_ATTACHED_TO_INDEX
+            elif persons_db is None:
+                message = _IDENTIFIED_NOT_ATTACHED_TO_INDEX
+            elif players_db is not persons_db:
+                message = _LISTS_NOT_ATTACHED_TO_SAME_DATABASE
+            else:
+                return players_db
+        self._show_problem(title, message)
+        return False
@@ -40,31 +40,32 @@ class PlayersRow(playerrecord.PlayerDBrecord, datarow.DataRow):
         )
     ]
 
+    row_specification = [
+        {
+            datarow.WIDGET: tkinter.Label,
+            datarow.WIDGET_CONFIGURE: {"anchor": anchor},
+            datarow.GRID_CONFIGURE: {
+                "column": column,
+                "sticky": tkinter.EW,
+            },
+            datarow.ROW: 0,
+        }
+        for column, anchor in (
+            (0, tkinter.CENTER),
+            (1, tkinter.CENTER),
+            (2, tkinter.CENTER),
+            (3, tkinter.CENTER),
+            (4, tkinter.CENTER),
+            (5, tkinter.CENTER),
+            (6, tkinter.CENTER),
+            (7, tkinter.CENTER),
+        )
+    ]
+
     def __init__(self, database=None):
         """Extend, define the data displayed from the Person record."""
         super().__init__()
         self.set_database(database)
-        self.row_specification = [
-            {
-                datarow.WIDGET: tkinter.Label,
-                datarow.WIDGET_CONFIGURE: {"anchor": anchor},
-                datarow.GRID_CONFIGURE: {
-                    "column": column,
-                    "sticky": tkinter.EW,
-                },
-                datarow.ROW: 0,
-            }
-            for column, anchor in (
-                (0, tkinter.CENTER),
-                (1, tkinter.CENTER),
-                (2, tkinter.CENTER),
-                (3, tkinter.CENTER),
-                (4, tkinter.CENTER),
-                (5, tkinter.CENTER),
-                (6, tkinter.CENTER),
-                (7, tkinter.CENTER),
-            )
-        ]
 
     def grid_row(self, **kargs):
         """Return tuple of instructions to create row.
@@ -73,16 +74,24 @@ class PlayersRow(playerrecord.PlayerDBrecord, datarow.DataRow):
 
         """
         value = self.value
+        fideid = value.fideid
+        name = value.name
+        event = value.event
+        eventdate = value.eventdate
+        section = value.section
+        stage = value.stage
+        team = value.team
+        type_ = value.type
         return super().grid_row(
             textitems=(
-                value.fideid if value.fideid is not None else "",
-                value.name if value.name is not None else "",
-                value.event if value.event is not None else "",
-                value.eventdate if value.eventdate is not None else "",
-                value.section if value.section is not None else "",
-                value.stage if value.stage is not None else "",
-                value.team if value.team is not None else "",
-                value.type if value.type is not None else "",
+                "" if fideid is None else fideid,
+                "" if name is None else name,
+                "" if event is None else event,
+                "" if eventdate is None else eventdate,
+                "" if section is None else section,
+                "" if stage is None else stage,
+                "" if team is None else team,
+                "" if type_ is None else type_,
             ),
             **kargs
         )
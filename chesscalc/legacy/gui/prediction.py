@@ -42,6 +42,8 @@ class Prediction:
                 self.names[key] = str(key)
         self.predictions = None
         self.calculations = None
+        self.season_starts = None
+        self.calculated_seasons = None
 
         self.perfcalc = show_report(
             parent=parent,
@@ -75,6 +77,7 @@ class Prediction:
 
         self.predictions = {}
         self.calculations = {}
+        self.season_starts = {}
         s_games = self.games
         s_game_opponent = self.game_opponent
         s_opponents = self.opponents
@@ -82,20 +85,18 @@ class Prediction:
         for seasonkey in sorted(self.seasons):
             svalue = self.seasons[seasonkey]
             season_start = "-".join((seasonkey.split("-")[0], "07", "01"))
-            games = {}
-            game_opponent = {}
+            self.season_starts[seasonkey] = season_start
+            games = {skey: s_games[skey] for skey in svalue}
+            game_opponent = {skey: s_game_opponent[skey] for skey in svalue}
             players = {}
-            game_opponent = {}
-            opponents = {}
-            names = {}
-            for skey in svalue:
-                games[skey] = s_games[skey]
-                game_opponent[skey] = s_game_opponent[skey]
-                for key in games[skey]:
+            for skey, gvalue in games.items():
+                for key in gvalue:
                     players.setdefault(key, set()).add(skey)
-            for key in players:
-                opponents[key] = {o for o in s_opponents[key] if o in players}
-                names[key] = s_names[key]
+            opponents = {
+                key: {o for o in s_opponents[key] if o in players}
+                for key in players
+            }
+            names = {key: s_names[key] for key in players}
             # Now do the base performance calculation for each season
             s_performance = performances.Performances()
             s_performance.get_events(games, players, game_opponent, opponents)
@@ -267,8 +268,10 @@ class Prediction:
                 )
             )
 
-        for ref in sorted(self.calculations):
-            ref_start = "-".join((ref.split("-")[0], "07", "01"))
+        self.calculated_seasons = sorted(self.calculations)
+        season_starts = self.season_starts
+        for ref in self.calculated_seasons:
+            ref_start = season_starts[ref]
             self.predictions[ref] = {}
             self.predictions[ref][ref] = performances.Distribution(
                 self.calculations[ref], self.calculations[ref]
@@ -286,10 +289,10 @@ class Prediction:
                     )
                 )
             )
-            for target in sorted(self.calculations):
+            for target in self.calculated_seasons:
                 if ref == target:
                     continue
-                target_start = "-".join((target.split("-")[0], "07", "01"))
+                target_start = season_starts[target]
                 self.predictions[ref][target] = performances.Distribution(
                     self.calculations[ref], self.calculations[target]
                 )
@@ -327,8 +330,9 @@ class Prediction:
                 )
             )
         )
-        for ref in sorted(self.predictions):
-            ref_start = "-".join((ref.split("-")[0], "07", "01"))
+        season_starts = self.season_starts
+        for ref in self.calculated_seasons:
+            ref_start = season_starts[ref]
             self.predictions[ref][ref].calculate_distribution(bucket_size)
             distribution = self.predictions[ref][ref].distributions[
                 bucket_size
@@ -368,12 +372,12 @@ class Prediction:
                     )
                 )
 
-        for target in sorted(self.predictions):
-            target_start = "-".join((target.split("-")[0], "07", "01"))
-            for ref in sorted(self.predictions):
+        for target in self.calculated_seasons:
+            target_start = season_starts[target]
+            for ref in self.calculated_seasons:
                 if ref == target:
                     continue
-                ref_start = "-".join((ref.split("-")[0], "07", "01"))
+                ref_start = season_starts[ref]
                 self.predictions[ref][target].calculate_distribution(
                     bucket_size
                 )
@@ -9,6 +9,11 @@ chess performance GUI.
 
 Spawn the deferred update process by the multiprocessing module.
 
+The module has few top-level imports because it is imported by the parent
+process, and by the child process under the 'spawn' start method, before
+the deferred update is started.  The deferred update user interface module
+is imported in the child process only, by the rundu function.
+
 """
 import sys
 import importlib
@@ -17,7 +22,6 @@ if sys.platform.startswith("openbsd"):
     import resource
 
 from .. import write_error_to_log
-from ..gui import performancedu
 
 
 class RunduError(Exception):
@@ -38,6 +42,10 @@ def rundu(
     A directory containing the chesstab package must be on sys.path.
 
     """
+    # pylint message import-outside-toplevel.
+    # Not needed in the parent process which starts the deferred update.
+    from ..gui import performancedu
+
     database_module = importlib.import_module(database_module_name)
     if sys.platform.startswith("openbsd"):
         # The default user class is limited to 512Mb memory but imports need
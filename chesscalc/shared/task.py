@@ -9,19 +9,23 @@ thread, but some do not.  The Task class runs a method according to the
 value of a class attribute of the Database instance driving the engine.
 
 """
-from multiprocessing import dummy
+import threading
 
 
 class Task:
     """Run a method directly or in a new thread, depending on database.
 
-    database is an instance of the Database class for the database engine.
+    database is an instance of the Database class for the database engine,
+    or None if target does not use a database.
     target is the method to run.
     args is a tuple of the target method's arguments.
     join_loop is the method which will wait for the target method to finish.
 
     database is often, but not necessarely, in args.
 
+    target is always run in a new thread if database is None: file output
+    for example.
+
     """
 
     def __init__(self, database, target, args, join_loop):
@@ -29,13 +33,16 @@ class Task:
         self._target = target
         self._args = args
         self._join_loop = join_loop
-        self._run_thread = database.__class__.can_use_thread
+        if database is None:
+            self._run_thread = True
+        else:
+            self._run_thread = database.__class__.can_use_thread
 
     def start_and_join(self):
         """Run self._target in new thread if self._run_thread is True."""
         if not self._run_thread:
             self._target(*self._args)
             return
-        thread = dummy.DummyProcess(target=self._target, args=self._args)
+        thread = threading.Thread(target=self._target, args=self._args)
         thread.start()
         self._join_loop(thread)